@@ -3,7 +3,7 @@
 Basic usage example for PyObComp.
 """
 
-from pyobcomp import ObjectComparator, ToleranceConfig, FieldConfig
+from pyobcomp import create, CompareProfile, FieldSettings, ComparisonOptions
 
 
 def main():
@@ -11,16 +11,17 @@ def main():
     print("PyObComp - Basic Usage Example")
     print("=" * 40)
     
-    # Create a comparator with custom tolerances
-    comparator = ObjectComparator(
-        tolerances={
-            'calories': ToleranceConfig(percentage=10.0),  # 10% tolerance
-            'protein': ToleranceConfig(percentage=10.0, absolute=2.0),  # 10% or 2.0, whichever is greater
-            'verified_calculation': FieldConfig(required=True),  # Must match exactly
-            'source_notes': FieldConfig(ignore=True),  # Ignore text fields
+    # Create a comparer with custom tolerances
+    profile = CompareProfile(
+        fields={
+            'calories': FieldSettings(percentage=10.0),  # 10% tolerance
+            'protein': FieldSettings(percentage=10.0, absolute=2.0),  # 10% or 2.0, whichever is greater
+            'verified_calculation': FieldSettings(required=True),  # Must match exactly
+            'source_notes': FieldSettings(ignore=True),  # Ignore text fields
         },
-        normalize_types=True  # Handle 9 vs 9.0, 2.0 vs 2
+        options=ComparisonOptions(normalize_types=True)  # Handle 9 vs 9.0, 2.0 vs 2
     )
+    comparer = create(profile)
     
     # Example data
     expected_data = {
@@ -39,7 +40,7 @@ def main():
     
     # Compare objects
     print("Comparing objects...")
-    result = comparator.compare(expected_data, actual_data)
+    result = comparer.compare(expected_data, actual_data)
     
     # Display results
     print(f"\nOverall result: {'PASS' if result.matches else 'FAIL'}")
@@ -9,24 +9,37 @@ in your application.
 import logging
 from pyobcomp import (
     create, CompareProfile, FieldSettings, ComparisonOptions, 
-    LoggingConfig, LoggingLevel, LoggingFormat, enable_logging
+    LoggingConfig, LoggingDetail, LoggingFormat, enable_logging
 )
 
+_configured = False
+
 def setup_logging():
     """Set up logging configuration for the example.
     
     NOTE: This setup is REQUIRED for logging to work, even when using auto_log.
     The Python logging system must be configured before any logging can occur.
+    Safe to call repeatedly: an application that already configured logging
+    keeps its handlers.
     """
     # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
     
-    # Configure pyobcomp logger specifically
+    _ensure_pyobcomp_logger()
+
+def _ensure_pyobcomp_logger():
+    """Configure the pyobcomp logger specifically (once per process)."""
+    global _configured
+    if _configured:
+        return
     pyobcomp_logger = logging.getLogger("pyobcomp.comparison")
     pyobcomp_logger.setLevel(logging.INFO)
+    _configured = True
 
 def example_silent_by_default():
     """Example showing that logging is silent by default."""
@@ -79,7 +92,7 @@ def example_basic_logging():
     logging_config = LoggingConfig(
         enabled=True,
         when="on_fail",  # Only log when comparison fails
-        level=LoggingLevel.FAILURES,
+        detail=LoggingDetail.FAILURES,
         format=LoggingFormat.TABLE
     )
     
@@ -112,7 +125,7 @@ def example_always_log_json():
     logging_config = LoggingConfig(
         enabled=True,
         when="always",
-        level=LoggingLevel.DIFFERENCES,
+        detail=LoggingDetail.DIFFERENCES,
         format=LoggingFormat.JSON
     )
     
@@ -260,7 +273,7 @@ def example_different_loggers():
     logging_config = LoggingConfig(
         enabled=True,
         when="always",
-        level=LoggingLevel.ALL,
+        detail=LoggingDetail.ALL,
         format=LoggingFormat.TABLE,
         logger_name="myapp.comparisons"  # Custom logger name
     )
@@ -62,6 +62,9 @@ setup(
         "yaml": [
             "PyYAML>=5.0",
         ],
+        "numpy": [
+            "numpy>=1.20",
+        ],
     },
     entry_points={
         "console_scripts": [
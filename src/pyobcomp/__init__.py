@@ -5,13 +5,17 @@ A robust object comparison framework with field-level tolerance settings
 and comprehensive reporting capabilities for testing and validation.
 """
 
-from .comparer import Comparer
-from .factory import ComparerFactory, load_profile, create_from_file, create, enable_logging
-from .models import (
-    ToleranceConfig, FieldConfig, FieldSettings, ComparisonOptions, 
-    ComparisonResult, FullComparisonResult, FieldResult, ComparisonStatus, CompareProfile,
-    LoggingConfig, LoggingDetail, LoggingFormat
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .comparer import Comparer
+    from .factory import ComparerFactory, load_profile, create_from_file, create, enable_logging
+    from .models import (
+        ToleranceConfig, FieldConfig, FieldSettings, ComparisonOptions, 
+        ComparisonResult, FullComparisonResult, FieldResult, ComparisonStatus, CompareProfile,
+        LoggingConfig, LoggingDetail, LoggingFormat
+    )
 
 __version__ = "0.1.0"
 __author__ = "Kris Rowe"
@@ -36,3 +40,46 @@ __all__ = [
     "LoggingDetail", 
     "LoggingFormat",
 ]
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package does not load pydantic, PyYAML and the comparison engine up front
+_LAZY_ATTRS = {
+    "Comparer": ".comparer",
+    "ComparerFactory": ".factory",
+    "load_profile": ".factory",
+    "create_from_file": ".factory",
+    "create": ".factory",
+    "enable_logging": ".factory",
+    "ToleranceConfig": ".models",
+    "FieldConfig": ".models",
+    "FieldSettings": ".models",
+    "ComparisonOptions": ".models",
+    "ComparisonResult": ".models",
+    "FullComparisonResult": ".models",
+    "FieldResult": ".models",
+    "ComparisonStatus": ".models",
+    "CompareProfile": ".models",
+    "LoggingConfig": ".models",
+    "LoggingDetail": ".models",
+    "LoggingFormat": ".models",
+}
+
+# Submodules stay reachable as attributes (``pyobcomp.models``) as they were
+# when the package imported them eagerly
+_SUBMODULES = ("models", "comparer", "factory", "comparator", "config")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_SUBMODULES))
@@ -2,28 +2,175 @@
 Main ObjectComparator class for PyObComp.
 """
 
-from typing import Dict, Any, Optional, Union, List
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+import functools
+import os
+import sys
 import yaml
 import re
 from .config import ToleranceConfig, FieldConfig, ComparisonOptions, ComparisonResult, Field, ComparisonStatus
 
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """Import NumPy on first use, so only long numeric lists pay for it.
+    
+    Returns None when NumPy is not installed; lists are then compared
+    element by element.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# (ignore, required, text_validation) for paths without a FieldConfig
+_DEFAULT_FIELD_RULE = (False, True, False)
+
+# Marks a path that has not been resolved yet (None means "no pattern")
+_MISSING = object()
+
+# Leaf types compared directly by _compare_primitives
+_PRIMITIVE_TYPES = frozenset((int, float, str, bool))
+
+# Leaf types where an identical object is always an exact match (not float: NaN)
+_IDENTITY_TYPES = frozenset((int, str, bool))
+
+# Paths remembered by _match_pattern (and _child_path) before the memo is reset
+_PATTERN_CACHE_SIZE = 4096
+
+# Ints within this bound (and their differences) are exact as float64
+_MAX_EXACT_INT = 2 ** 52
+
+# Precomputed list index suffixes for the common short-list case
+_INDEX_STRS = tuple(sys.intern(f"[{i}]") for i in range(1024))
+
+
+def _index_str(index: int) -> str:
+    """Get the path suffix for a list index."""
+    return _INDEX_STRS[index] if index < 1024 else f"[{index}]"
+
+_PASSED_SUMMARY = "Comparison passed with 0 differences"
+
+# Float lists shorter than this are cheaper to compare element by element
+_VECTORIZE_MIN_LENGTH = 32
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a field path pattern where * matches any run of characters.
+    
+    A '.*' segment needs a child separator after its prefix: 'meta.*' matches
+    'meta.id' and 'meta[0]' but not 'meta' itself or a sibling like
+    'metadata'. List indices count as children, so 'items.*.calories' matches
+    'items[0].calories'.
+    """
+    regex = re.escape(pattern).replace(r'\.\*', r'(?:\..+|\[.+)').replace(r'\*', '.*')
+    return re.compile(f"^{regex}$")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_config(config_path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file, cached per path and modification time.
+    
+    The returned data is shared between callers and must not be mutated.
+    """
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _make_tolerance_check(config: ToleranceConfig) -> Callable[[float], tuple[float, str, str]]:
+    """Specialize tolerance selection for a single ToleranceConfig.
+    
+    The returned function maps an expected value to the tolerance that applies
+    to it, a label describing which tolerance was used and the matching
+    "within tolerance" reason. Which of percentage and absolute are configured
+    is resolved here, once, rather than on every numeric comparison.
+    """
+    percentage = config.percentage
+    absolute = config.absolute
+    percentage_type = f"{percentage}%"
+    absolute_type = f"{absolute} absolute"
+    percentage_reason = f"Within tolerance ({percentage_type})"
+    absolute_reason = f"Within tolerance ({absolute_type})"
+    
+    if percentage is None:
+        def tolerance_for(expected: float) -> tuple[float, str, str]:
+            return absolute, absolute_type, absolute_reason
+    elif absolute is None:
+        def tolerance_for(expected: float) -> tuple[float, str, str]:
+            return abs(expected * percentage / 100.0), percentage_type, percentage_reason
+    else:
+        # Whichever tolerance is greater wins
+        def tolerance_for(expected: float) -> tuple[float, str, str]:
+            percentage_tolerance = abs(expected * percentage / 100.0)
+            if percentage_tolerance >= absolute:
+                return percentage_tolerance, percentage_type, percentage_reason
+            return absolute, absolute_type, absolute_reason
+    
+    return tolerance_for
+
 
 class ObjectComparator:
     """Main class for object comparison with tolerance settings."""
     
     def __init__(
         self,
-        tolerances: Optional[Dict[str, Union[ToleranceConfig, FieldConfig]]] = None,
-        options: Optional[ComparisonOptions] = None
+        tolerances: dict[str, ToleranceConfig | FieldConfig] | None = None,
+        options: ComparisonOptions | None = None
     ):
         """Initialize the comparator.
         
+        Tolerances and options are specialized at construction time, so they
+        should not be mutated afterwards.
+        
         Args:
             tolerances: Dictionary mapping field paths to tolerance/field configs
             options: Global comparison options
         """
-        self.tolerances = tolerances or {}
+        # Intern patterns so lookups with the same key object skip string compares
+        self.tolerances = {sys.intern(pattern): config for pattern, config in (tolerances or {}).items()}
         self.options = options or ComparisonOptions()
+        self._normalize_types = self.options.normalize_types
+        
+        # Precompile one numeric check per tolerance pattern
+        self._tolerance_checks = {
+            pattern: _make_tolerance_check(config)
+            for pattern, config in self.tolerances.items()
+            if isinstance(config, ToleranceConfig)
+        }
+        
+        # Flatten each FieldConfig into an (ignore, required, text_validation) tuple
+        self._field_rules = {
+            pattern: (config.ignore, config.required, config.text_validation)
+            for pattern, config in self.tolerances.items()
+            if isinstance(config, FieldConfig)
+        }
+        
+        # Wildcard patterns compiled once, in configuration order
+        self._compiled_patterns = [
+            (_compile_pattern(pattern), pattern)
+            for pattern in self.tolerances
+            if '*' in pattern
+        ]
+        
+        # Interned child path per (parent path, dict key)
+        self._path_cache: dict[tuple[str, str], str] = {}
+        
+        # Resolved pattern (or None) per visited path
+        self._pattern_cache: dict[str, str | None] = {}
+        
+        # LRU of (expected, actual, result) keyed by object identity
+        self._id_cache: OrderedDict[tuple[int, int], tuple[Any, Any, ComparisonResult]] = OrderedDict()
     
     @classmethod
     def from_yaml(cls, config_path: str) -> 'ObjectComparator':
@@ -35,8 +182,8 @@ class ObjectComparator:
         Returns:
             Configured ObjectComparator instance
         """
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config_path = os.path.abspath(config_path)
+        config = _load_yaml_config(config_path, os.stat(config_path).st_mtime_ns)
         
         # Parse fields configuration
         tolerances = {}
@@ -74,24 +221,82 @@ class ObjectComparator:
         Returns:
             ComparisonResult with detailed comparison information
         """
+        cache_key = None
+        if self.options.enable_identity_cache:
+            cache_key = (id(expected), id(actual))
+            cached = self._id_cache.get(cache_key)
+            # Entries hold the compared objects, so their ids cannot be reused
+            if cached is not None and cached[0] is expected and cached[1] is actual:
+                self._id_cache.move_to_end(cache_key)
+                return cached[2]
+        
         fields = []
-        all_passed = True
         
         # Start comparison at root level
-        result = self._compare_values("", expected, actual, fields)
-        all_passed = result.matches
+        all_passed = self._compare_values("", expected, actual, fields)
         
-        return ComparisonResult(
-            matches=all_passed,
-            summary=f"Comparison {'passed' if all_passed else 'failed'} with {len([f for f in fields if not f.passed])} differences",
-            fields=fields
-        )
+        if all_passed:
+            # Every recorded field passed, so there is nothing to count
+            summary = _PASSED_SUMMARY
+        else:
+            failures = sum(1 for field in fields if not field.passed)
+            summary = f"Comparison failed with {failures} differences"
+        
+        result = ComparisonResult(matches=all_passed, summary=summary, fields=fields)
+        
+        if cache_key is not None:
+            self._id_cache[cache_key] = (expected, actual, result)
+            if len(self._id_cache) > self.options.cache_size:
+                self._id_cache.popitem(last=False)
+        
+        return result
     
-    def _compare_values(self, path: str, expected: Any, actual: Any, fields: List[Field]) -> ComparisonResult:
-        """Compare two values at a specific path."""
+    def compare_batch(self, expected_items: Sequence[Any], actual_items: Sequence[Any]) -> list[ComparisonResult]:
+        """Compare many pairs of objects.
+        
+        Args:
+            expected_items: Expected objects
+            actual_items: Actual objects, paired with expected_items by position
+            
+        Returns:
+            One ComparisonResult per pair, in order
+        """
+        if len(expected_items) != len(actual_items):
+            raise ValueError(
+                f"Batch length mismatch: {len(expected_items)} expected vs {len(actual_items)} actual"
+            )
+        
+        compare = self.compare
+        return [compare(expected, actual) for expected, actual in zip(expected_items, actual_items)]
+    
+    def clear_cache(self) -> None:
+        """Drop all results memoized by the identity cache."""
+        self._id_cache.clear()
+    
+    def _compare_values(self, path: str, expected: Any, actual: Any, fields: list[Field]) -> bool:
+        """Compare two values at a specific path, returning whether they match.
+        
+        Nested containers are walked with an explicit stack rather than by
+        recursion; fields are recorded in the same depth-first order.
+        """
+        all_passed = True
+        stack = [(path, expected, actual)]
+        pop = stack.pop
+        compare_node = self._compare_node
+        
+        while stack:
+            path, expected, actual = pop()
+            if not compare_node(path, expected, actual, fields, stack):
+                all_passed = False
+        
+        return all_passed
+    
+    def _compare_node(self, path: str, expected: Any, actual: Any, fields: list[Field], stack: list) -> bool:
+        """Compare one node, pushing container children onto the stack."""
         # Check if this field should be ignored
-        field_config = self._get_field_config(path)
-        if field_config and field_config.ignore:
+        pattern = self._match_pattern(path)
+        ignore, required, _ = self._field_rules.get(pattern, _DEFAULT_FIELD_RULE)
+        if ignore:
             fields.append(Field(
                 name=path or "root",
                 passed=True,
@@ -100,7 +305,7 @@ class ObjectComparator:
                 actual=actual,
                 reason="Field configured to ignore"
             ))
-            return ComparisonResult(matches=True, summary="Field ignored", fields=[])
+            return True
         
         # Handle missing values
         if expected is None and actual is None:
@@ -112,10 +317,10 @@ class ObjectComparator:
                 actual=actual,
                 reason="Both values are None"
             ))
-            return ComparisonResult(matches=True, summary="Both None", fields=[])
+            return True
         
         if expected is None:
-            if field_config and not field_config.required:
+            if not required:
                 fields.append(Field(
                     name=path or "root",
                     passed=True,
@@ -124,7 +329,7 @@ class ObjectComparator:
                     actual=actual,
                     reason="Optional field missing in expected"
                 ))
-                return ComparisonResult(matches=True, summary="Optional field missing", fields=[])
+                return True
             else:
                 fields.append(Field(
                     name=path or "root",
@@ -134,10 +339,10 @@ class ObjectComparator:
                     actual=actual,
                     reason="Required field missing in expected"
                 ))
-                return ComparisonResult(matches=False, summary="Required field missing", fields=[])
+                return False
         
         if actual is None:
-            if field_config and not field_config.required:
+            if not required:
                 fields.append(Field(
                     name=path or "root",
                     passed=True,
@@ -146,7 +351,7 @@ class ObjectComparator:
                     actual=actual,
                     reason="Optional field missing in actual"
                 ))
-                return ComparisonResult(matches=True, summary="Optional field missing", fields=[])
+                return True
             else:
                 fields.append(Field(
                     name=path or "root",
@@ -156,10 +361,22 @@ class ObjectComparator:
                     actual=actual,
                     reason="Required field missing in actual"
                 ))
-                return ComparisonResult(matches=False, summary="Required field missing", fields=[])
+                return False
         
-        # Type checking
-        if not self._types_compatible(expected, actual):
+        # The same immutable leaf object on both sides matches without further checks
+        if expected is actual and type(expected) in _IDENTITY_TYPES:
+            fields.append(Field(
+                name=path or "root",
+                passed=True,
+                status=ComparisonStatus.IDENTICAL,
+                expected=expected,
+                actual=actual,
+                reason="Values match exactly"
+            ))
+            return True
+        
+        # Type checking (same exact type is always compatible)
+        if type(expected) is not type(actual) and not self._types_compatible(expected, actual):
             fields.append(Field(
                 name=path or "root",
                 passed=False,
@@ -170,36 +387,57 @@ class ObjectComparator:
                 expected_type=type(expected).__name__,
                 actual_type=type(actual).__name__
             ))
-            return ComparisonResult(matches=False, summary="Type mismatch", fields=[])
+            return False
         
-        # Handle different data types
+        # Exact builtin types dispatch on type() alone
+        expected_type = type(expected)
+        if expected_type is type(actual):
+            if expected_type is dict:
+                return self._compare_dicts(path, expected, actual, stack)
+            if expected_type is list:
+                return self._compare_lists(path, expected, actual, fields, stack)
+            if expected_type in _PRIMITIVE_TYPES:
+                return self._compare_primitives(path, expected, actual, fields, pattern)
+        
+        # Handle different data types (including subclasses)
         if isinstance(expected, dict) and isinstance(actual, dict):
-            return self._compare_dicts(path, expected, actual, fields)
+            return self._compare_dicts(path, expected, actual, stack)
         elif isinstance(expected, list) and isinstance(actual, list):
-            return self._compare_lists(path, expected, actual, fields)
-        else:
-            return self._compare_primitives(path, expected, actual, fields)
+            return self._compare_lists(path, expected, actual, fields, stack)
+        
+        # Arrays can only exist once the caller has imported NumPy
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(expected, numpy.ndarray) and isinstance(actual, numpy.ndarray):
+            return self._compare_ndarrays(path, expected, actual, fields, pattern)
+        return self._compare_primitives(path, expected, actual, fields, pattern)
     
-    def _compare_dicts(self, path: str, expected: Dict, actual: Dict, fields: List[Field]) -> ComparisonResult:
-        """Compare two dictionaries."""
-        all_passed = True
-        all_keys = set(expected.keys()) | set(actual.keys())
+    def _compare_dicts(self, path: str, expected: dict, actual: dict, stack: list) -> bool:
+        """Queue the entries of two dictionaries for comparison.
         
-        for key in all_keys:
-            key_path = f"{path}.{key}" if path else key
-            exp_value = expected.get(key)
-            act_value = actual.get(key)
-            
-            result = self._compare_values(key_path, exp_value, act_value, fields)
-            if not result.matches:
-                all_passed = False
+        Entries are compared in the expected dict's key order, followed by any
+        keys only present in actual.
+        """
+        child_path = self._child_path
         
-        return ComparisonResult(matches=all_passed, summary="Dict comparison", fields=[])
+        if expected.keys() == actual.keys():
+            # Same keys (the common case): no key union needed
+            children = [(child_path(path, key), value, actual[key]) for key, value in expected.items()]
+        else:
+            actual_get = actual.get
+            children = [(child_path(path, key), value, actual_get(key)) for key, value in expected.items()]
+            children.extend(
+                (child_path(path, key), None, value)
+                for key, value in actual.items()
+                if key not in expected
+            )
+        
+        # Reversed so the stack pops them in key order
+        children.reverse()
+        stack.extend(children)
+        return True
     
-    def _compare_lists(self, path: str, expected: List, actual: List, fields: List[Field]) -> ComparisonResult:
-        """Compare two lists."""
-        all_passed = True
-        
+    def _compare_lists(self, path: str, expected: list, actual: list, fields: list[Field], stack: list) -> bool:
+        """Compare two lists, queueing their items for comparison."""
         if len(expected) != len(actual):
             fields.append(Field(
                 name=f"{path}.length" if path else "length",
@@ -209,17 +447,210 @@ class ObjectComparator:
                 actual=len(actual),
                 reason=f"Array length mismatch: expected {len(expected)}, got {len(actual)}"
             ))
-            all_passed = False
-        else:
-            for i, (exp_item, act_item) in enumerate(zip(expected, actual)):
-                item_path = f"{path}[{i}]" if path else f"[{i}]"
-                result = self._compare_values(item_path, exp_item, act_item, fields)
-                if not result.matches:
+            return False
+        
+        if (len(expected) >= _VECTORIZE_MIN_LENGTH and _numpy() is not None
+                and self._is_vectorizable(expected, actual)):
+            return self._compare_float_lists(path, expected, actual, fields)
+        
+        children = [
+            (path + _index_str(i), exp_item, act_item)
+            for i, (exp_item, act_item) in enumerate(zip(expected, actual))
+        ]
+        # Reversed so the stack pops them in index order
+        children.reverse()
+        stack.extend(children)
+        return True
+    
+    def _compare_float_lists(self, path: str, expected: list[float], actual: list[float], fields: list[Field]) -> bool:
+        """Compare two equal-length numeric lists with vectorized tolerance math.
+        
+        Produces the same per-item fields as the element-by-element path. Falls
+        back to that path when items resolve to different rules or to a
+        FieldConfig.
+        """
+        item_paths = [path + _index_str(i) for i in range(len(expected))]
+        patterns = {self._match_pattern(item_path) for item_path in item_paths}
+        config = self.tolerances.get(patterns.pop()) if len(patterns) == 1 else None
+        if len(patterns) > 0 or isinstance(config, FieldConfig):
+            all_passed = True
+            for item_path, exp_item, act_item in zip(item_paths, expected, actual):
+                if not self._compare_values(item_path, exp_item, act_item, fields):
                     all_passed = False
+            return all_passed
+        
+        np = _numpy()
+        exp = np.array(expected, dtype=np.float64)
+        act = np.array(actual, dtype=np.float64)
+        identical_mask = exp == act
+        identical = identical_mask.tolist()
+        
+        if config is None or identical_mask.all():
+            # No tolerance math needed: identical items match, anything else is a mismatch
+            for item_path, exp_item, act_item, same in zip(item_paths, expected, actual, identical):
+                if same:
+                    fields.append(Field(
+                        name=item_path,
+                        passed=True,
+                        status=ComparisonStatus.IDENTICAL,
+                        expected=exp_item,
+                        actual=act_item,
+                        reason="Values match exactly"
+                    ))
+                else:
+                    fields.append(Field(
+                        name=item_path,
+                        passed=False,
+                        status=ComparisonStatus.VALUE_MISMATCH,
+                        expected=exp_item,
+                        actual=act_item,
+                        reason=f"Value mismatch: expected {exp_item}, got {act_item} (no tolerance configured)"
+                    ))
+            return all(identical)
+        
+        # Same arithmetic, in the same order, as _make_tolerance_check
+        percentage_type = f"{config.percentage}%"
+        absolute_type = f"{config.absolute} absolute"
+        percentage_reason = f"Within tolerance ({percentage_type})"
+        absolute_reason = f"Within tolerance ({absolute_type})"
+        with np.errstate(invalid='ignore', over='ignore'):
+            if config.percentage is None:
+                tolerances = np.full(exp.shape, config.absolute, dtype=np.float64)
+                uses_percentage = np.zeros(exp.shape, dtype=bool)
+            else:
+                tolerances = np.abs(exp * config.percentage / 100.0)
+                if config.absolute is None:
+                    uses_percentage = np.ones(exp.shape, dtype=bool)
+                else:
+                    uses_percentage = tolerances >= config.absolute
+                    tolerances = np.where(uses_percentage, tolerances, config.absolute)
+            differences = np.abs(exp - act)
+            within = (differences <= tolerances).tolist()
         
-        return ComparisonResult(matches=all_passed, summary="List comparison", fields=[])
+        all_passed = True
+        for item_path, exp_item, act_item, same, ok, difference, tolerance, by_percentage in zip(
+                item_paths, expected, actual, identical, within,
+                differences.tolist(), tolerances.tolist(), uses_percentage.tolist()):
+            if same:
+                fields.append(Field(
+                    name=item_path,
+                    passed=True,
+                    status=ComparisonStatus.IDENTICAL,
+                    expected=exp_item,
+                    actual=act_item,
+                    reason="Values match exactly"
+                ))
+                continue
+            if by_percentage:
+                tolerance_type, within_reason = percentage_type, percentage_reason
+            else:
+                tolerance_type, within_reason = absolute_type, absolute_reason
+            if ok:
+                fields.append(Field(
+                    name=item_path,
+                    passed=True,
+                    status=ComparisonStatus.IN_TOLERANCE,
+                    expected=exp_item,
+                    actual=act_item,
+                    reason=within_reason,
+                    tolerance_applied=tolerance_type
+                ))
+            else:
+                fields.append(Field(
+                    name=item_path,
+                    passed=False,
+                    status=ComparisonStatus.OUTSIDE_TOLERANCE,
+                    expected=exp_item,
+                    actual=act_item,
+                    reason=f"Outside tolerance ({tolerance_type}): difference {difference:.2f} > tolerance {tolerance:.2f}",
+                    tolerance_applied=tolerance_type
+                ))
+                all_passed = False
+        return all_passed
+    
+    def _compare_ndarrays(self, path: str, expected: numpy.ndarray, actual: numpy.ndarray, fields: list[Field], pattern: str | None) -> bool:
+        """Compare two NumPy arrays as a single field with array-native operations.
+        
+        A ToleranceConfig for the array's path applies element-wise, with the
+        same "greater tolerance wins" rule as scalar values.
+        """
+        np = _numpy()
+        name = path or "root"
+        if expected.shape != actual.shape:
+            fields.append(Field(
+                name=f"{path}.shape" if path else "shape",
+                passed=False,
+                status=ComparisonStatus.ARRAY_LENGTH_MISMATCH,
+                expected=expected.shape,
+                actual=actual.shape,
+                reason=f"Array shape mismatch: expected {expected.shape}, got {actual.shape}"
+            ))
+            return False
+        
+        if np.array_equal(expected, actual):
+            fields.append(Field(
+                name=name,
+                passed=True,
+                status=ComparisonStatus.IDENTICAL,
+                expected=expected,
+                actual=actual,
+                reason="Values match exactly"
+            ))
+            return True
+        
+        config = self.tolerances.get(pattern)
+        numeric = (np.issubdtype(expected.dtype, np.number) and np.issubdtype(actual.dtype, np.number)
+                   and not np.issubdtype(expected.dtype, np.complexfloating)
+                   and not np.issubdtype(actual.dtype, np.complexfloating))
+        if not isinstance(config, ToleranceConfig) or not numeric:
+            fields.append(Field(
+                name=name,
+                passed=False,
+                status=ComparisonStatus.VALUE_MISMATCH,
+                expected=expected,
+                actual=actual,
+                reason="Array values mismatch (no tolerance configured)"
+            ))
+            return False
+        
+        exp = expected.astype(np.float64)
+        act = actual.astype(np.float64)
+        with np.errstate(invalid='ignore', over='ignore'):
+            if config.percentage is None:
+                tolerances = np.full(exp.shape, config.absolute, dtype=np.float64)
+                tolerance_type = f"{config.absolute} absolute"
+            else:
+                tolerances = np.abs(exp * config.percentage / 100.0)
+                tolerance_type = f"{config.percentage}%"
+                if config.absolute is not None:
+                    tolerances = np.maximum(tolerances, config.absolute)
+                    tolerance_type = f"{config.percentage}% or {config.absolute} absolute"
+            outside = np.count_nonzero(~(np.abs(exp - act) <= tolerances))
+        
+        if outside == 0:
+            fields.append(Field(
+                name=name,
+                passed=True,
+                status=ComparisonStatus.IN_TOLERANCE,
+                expected=expected,
+                actual=actual,
+                reason=f"Within tolerance ({tolerance_type})",
+                tolerance_applied=tolerance_type
+            ))
+            return True
+        
+        fields.append(Field(
+            name=name,
+            passed=False,
+            status=ComparisonStatus.OUTSIDE_TOLERANCE,
+            expected=expected,
+            actual=actual,
+            reason=f"Outside tolerance ({tolerance_type}): {outside} of {exp.size} elements differ",
+            tolerance_applied=tolerance_type
+        ))
+        return False
     
-    def _compare_primitives(self, path: str, expected: Any, actual: Any, fields: List[Field]) -> ComparisonResult:
+    def _compare_primitives(self, path: str, expected: Any, actual: Any, fields: list[Field], pattern: str | None) -> bool:
         """Compare primitive values (numbers, strings, booleans)."""
         # Check for exact match first
         if expected == actual:
@@ -231,17 +662,20 @@ class ObjectComparator:
                 actual=actual,
                 reason="Values match exactly"
             ))
-            return ComparisonResult(matches=True, summary="Exact match", fields=[])
+            return True
         
         # Check if this is a numerical comparison with tolerance
         if self._is_numerical(expected) and self._is_numerical(actual):
-            return self._compare_numerical_with_tolerance(path, expected, actual, fields)
+            return self._compare_numerical_with_tolerance(path, expected, actual, fields, pattern)
         
         # Check for text validation
-        field_config = self._get_field_config(path)
-        if field_config and field_config.text_validation:
+        if self._field_rules.get(pattern, _DEFAULT_FIELD_RULE)[2]:
             # For text validation, only check that actual is not empty
-            if actual and str(actual).strip():
+            if type(actual) is str:
+                non_empty = bool(actual) and not actual.isspace()
+            else:
+                non_empty = bool(actual) and bool(str(actual).strip())
+            if non_empty:
                 fields.append(Field(
                     name=path or "root",
                     passed=True,
@@ -250,7 +684,7 @@ class ObjectComparator:
                     actual=actual,
                     reason="Text validation passed (non-empty)"
                 ))
-                return ComparisonResult(matches=True, summary="Text validation passed", fields=[])
+                return True
             else:
                 fields.append(Field(
                     name=path or "root",
@@ -260,7 +694,7 @@ class ObjectComparator:
                     actual=actual,
                     reason="Text validation failed (empty or None)"
                 ))
-                return ComparisonResult(matches=False, summary="Text validation failed", fields=[])
+                return False
         
         # Default: exact match required
         fields.append(Field(
@@ -271,13 +705,13 @@ class ObjectComparator:
             actual=actual,
             reason=f"Value mismatch: expected {expected}, got {actual}"
         ))
-        return ComparisonResult(matches=False, summary="Value mismatch", fields=[])
+        return False
     
-    def _compare_numerical_with_tolerance(self, path: str, expected: float, actual: float, fields: List[Field]) -> ComparisonResult:
+    def _compare_numerical_with_tolerance(self, path: str, expected: float, actual: float, fields: list[Field], pattern: str | None) -> bool:
         """Compare numerical values with tolerance settings."""
-        field_config = self._get_field_config(path)
+        tolerance_for = self._tolerance_checks.get(pattern)
         
-        if not field_config or not isinstance(field_config, ToleranceConfig):
+        if tolerance_for is None:
             # No tolerance configured, require exact match
             fields.append(Field(
                 name=path or "root",
@@ -287,47 +721,9 @@ class ObjectComparator:
                 actual=actual,
                 reason=f"Value mismatch: expected {expected}, got {actual} (no tolerance configured)"
             ))
-            return ComparisonResult(matches=False, summary="Value mismatch", fields=[])
-        
-        # Calculate tolerances
-        percentage_tolerance = None
-        absolute_tolerance = None
-        
-        if field_config.percentage is not None:
-            percentage_tolerance = abs(expected * field_config.percentage / 100.0)
-        
-        if field_config.absolute is not None:
-            absolute_tolerance = field_config.absolute
-        
-        # Determine which tolerance to use (whichever is greater)
-        tolerance = None
-        tolerance_type = None
+            return False
         
-        if percentage_tolerance is not None and absolute_tolerance is not None:
-            if percentage_tolerance >= absolute_tolerance:
-                tolerance = percentage_tolerance
-                tolerance_type = f"{field_config.percentage}%"
-            else:
-                tolerance = absolute_tolerance
-                tolerance_type = f"{field_config.absolute} absolute"
-        elif percentage_tolerance is not None:
-            tolerance = percentage_tolerance
-            tolerance_type = f"{field_config.percentage}%"
-        elif absolute_tolerance is not None:
-            tolerance = absolute_tolerance
-            tolerance_type = f"{field_config.absolute} absolute"
-        
-        if tolerance is None:
-            # No tolerance configured
-            fields.append(Field(
-                name=path or "root",
-                passed=False,
-                status=ComparisonStatus.VALUE_MISMATCH,
-                expected=expected,
-                actual=actual,
-                reason=f"Value mismatch: expected {expected}, got {actual} (no tolerance configured)"
-            ))
-            return ComparisonResult(matches=False, summary="Value mismatch", fields=[])
+        tolerance, tolerance_type, within_reason = tolerance_for(expected)
         
         # Check if within tolerance
         difference = abs(expected - actual)
@@ -338,10 +734,10 @@ class ObjectComparator:
                 status=ComparisonStatus.IN_TOLERANCE,
                 expected=expected,
                 actual=actual,
-                reason=f"Within tolerance ({tolerance_type})",
+                reason=within_reason,
                 tolerance_applied=tolerance_type
             ))
-            return ComparisonResult(matches=True, summary="Within tolerance", fields=[])
+            return True
         else:
             fields.append(Field(
                 name=path or "root",
@@ -352,41 +748,55 @@ class ObjectComparator:
                 reason=f"Outside tolerance ({tolerance_type}): difference {difference:.2f} > tolerance {tolerance:.2f}",
                 tolerance_applied=tolerance_type
             ))
-            return ComparisonResult(matches=False, summary="Outside tolerance", fields=[])
+            return False
     
-    def _get_field_config(self, path: str) -> Optional[Union[ToleranceConfig, FieldConfig]]:
+    def _get_field_config(self, path: str) -> ToleranceConfig | FieldConfig | None:
         """Get field configuration for a given path."""
+        return self.tolerances.get(self._match_pattern(path))
+    
+    def _child_path(self, path: str, key: Any) -> str:
+        """Get the interned path of a dict entry, reusing it across compares."""
+        if type(key) is not str:
+            # Non-string keys like 1 and True hash alike, so don't share entries
+            return f"{path}.{key}" if path else str(key)
+        cache_key = (path, key)
+        child = self._path_cache.get(cache_key)
+        if child is None:
+            child = sys.intern(f"{path}.{key}" if path else key)
+            if len(self._path_cache) >= _PATTERN_CACHE_SIZE:
+                self._path_cache.clear()
+            self._path_cache[cache_key] = child
+        return child
+    
+    def _match_pattern(self, path: str) -> str | None:
+        """Get the configured pattern that applies to a given path."""
+        cached = self._pattern_cache.get(path, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
         # Direct match first
         if path in self.tolerances:
-            return self.tolerances[path]
-        
-        # Try wildcard matching
-        for pattern, config in self.tolerances.items():
-            if self._path_matches_pattern(path, pattern):
-                return config
-        
-        return None
-    
-    def _path_matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if a field path matches a pattern with wildcards."""
-        # Convert pattern to regex
-        # Replace * with .* for wildcard matching
-        regex_pattern = pattern.replace('*', '.*')
-        regex_pattern = regex_pattern.replace('.', r'\.')  # Escape dots
-        regex_pattern = regex_pattern.replace(r'\.*', '.*')  # Fix wildcard after escaped dot
-        
-        try:
-            return bool(re.match(f"^{regex_pattern}$", path))
-        except re.error:
-            return False
+            matched = path
+        else:
+            # Try wildcard matching
+            matched = None
+            for regex, pattern in self._compiled_patterns:
+                if regex.match(path):
+                    matched = pattern
+                    break
+        
+        if len(self._pattern_cache) >= _PATTERN_CACHE_SIZE:
+            self._pattern_cache.clear()
+        self._pattern_cache[path] = matched
+        return matched
     
     def _types_compatible(self, expected: Any, actual: Any) -> bool:
         """Check if two values have compatible types."""
-        if type(expected) == type(actual):
+        if type(expected) is type(actual):
             return True
         
         # Handle type normalization
-        if self.options.normalize_types:
+        if self._normalize_types:
             # Check for int/float compatibility
             if self._is_numerical(expected) and self._is_numerical(actual):
                 return True
@@ -397,8 +807,37 @@ class ObjectComparator:
         
         return False
     
+    def _is_vectorizable(self, expected: list[Any], actual: list[Any]) -> bool:
+        """Check if two equal-length lists can be compared as float64 arrays.
+        
+        Items must be floats or ints that convert exactly, and each pair must
+        share a type unless normalize_types allows int/float mixing.
+        """
+        if self._is_float_list(expected) and self._is_float_list(actual):
+            return True
+        if not (self._is_exact_numeric_list(expected) and self._is_exact_numeric_list(actual)):
+            return False
+        if self._normalize_types:
+            return True
+        return all(type(exp_item) is type(act_item) for exp_item, act_item in zip(expected, actual))
+    
+    def _is_float_list(self, values: list[Any]) -> bool:
+        """Check if every item of a list is a float."""
+        return all(type(value) is float for value in values)
+    
+    def _is_exact_numeric_list(self, values: list[Any]) -> bool:
+        """Check if every item is a float or an int that float64 holds exactly."""
+        return all(
+            type(value) is float
+            or (type(value) is int and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT)
+            for value in values
+        )
+    
     def _is_numerical(self, value: Any) -> bool:
         """Check if a value is numerical."""
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            return True
         return isinstance(value, (int, float)) and not isinstance(value, bool)
 
 
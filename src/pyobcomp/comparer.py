@@ -2,14 +2,181 @@
 Main Comparer class for PyObComp.
 """
 
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple, Callable
+import functools
 import re
+import sys
 
 from .models import (
     ToleranceConfig, FieldConfig, ComparisonOptions, 
     FullComparisonResult, FieldResult, ComparisonStatus
 )
 
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """Import NumPy on first use, so only long numeric lists pay for it.
+    
+    Returns None when NumPy is not installed; lists are then compared
+    element by element.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# Marks a path that has not been resolved yet (None means "no config"),
+# and a list item that is missing from the actual list
+_MISSING = object()
+
+# (ignore, required, text_validation) for paths without a FieldConfig
+_DEFAULT_FIELD_RULE = (False, True, False)
+
+# Leaf types where an identical object is always an exact match (not float: NaN)
+_IDENTITY_TYPES = frozenset((int, str, bool))
+
+# Leaf types compared directly, without container checks
+_PRIMITIVE_TYPES = frozenset((int, float, str, bool))
+
+# FieldResult fields every comparer result sets explicitly
+_REQUIRED_RESULT_FIELDS = frozenset(('name', 'passed', 'status', 'expected', 'actual', 'reason'))
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+# Paths remembered by _get_field_config (and _child_path) before the memo is reset
+_CONFIG_CACHE_SIZE = 4096
+
+# Numeric lists shorter than this are cheaper to compare element by element
+_VECTORIZE_MIN_LENGTH = 32
+
+# Ints within this bound (and their differences) are exact as float64
+_MAX_EXACT_INT = 2 ** 52
+
+# Precomputed list index suffixes for the common short-list case
+_INDEX_STRS = tuple(sys.intern(f"[{i}]") for i in range(1024))
+
+
+def _index_str(index: int) -> str:
+    """Get the path suffix for a list index."""
+    return _INDEX_STRS[index] if index < 1024 else f"[{index}]"
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a field path pattern where * matches any run of characters.
+    
+    A '.*' segment also matches list indices, so 'items.*.calories' matches
+    'items[0].calories'.
+    """
+    regex = re.escape(pattern).replace(r'\.\*', '.*').replace(r'\*', '.*')
+    return re.compile(f"^{regex}$")
+
+
+def _literal_affixes(pattern: str) -> Tuple[str, str]:
+    """Get the literal text a path must start and end with to match a pattern.
+    
+    A '.' directly before the first * belongs to the wildcard, since '.*' also
+    matches list indices.
+    """
+    prefix = pattern[:pattern.index('*')]
+    if prefix.endswith('.'):
+        prefix = prefix[:-1]
+    return prefix, pattern[pattern.rindex('*') + 1:]
+
+
+def _make_tolerance_check(config: ToleranceConfig) -> Optional[Callable[[float], Tuple[float, str, str]]]:
+    """Specialize tolerance selection for a single ToleranceConfig.
+    
+    The returned function maps an expected value to the tolerance that applies
+    to it, a label describing which tolerance was used and the matching
+    "within tolerance" reason, so passing values need no string formatting.
+    Returns None when the config sets neither tolerance.
+    """
+    percentage = config.percentage
+    absolute = config.absolute
+    percentage_type = f"{percentage}%"
+    absolute_type = f"{absolute} absolute"
+    percentage_rule = (percentage_type, f"Within tolerance ({percentage_type})")
+    absolute_rule = (absolute_type, f"Within tolerance ({absolute_type})")
+    
+    if percentage is None and absolute is None:
+        return None
+    if percentage is None:
+        def tolerance_for(expected: float) -> Tuple[float, str, str]:
+            return (absolute, *absolute_rule)
+    elif absolute is None:
+        def tolerance_for(expected: float) -> Tuple[float, str, str]:
+            return (abs(expected * percentage / 100.0), *percentage_rule)
+    else:
+        # Whichever tolerance is greater wins
+        def tolerance_for(expected: float) -> Tuple[float, str, str]:
+            percentage_tolerance = abs(expected * percentage / 100.0)
+            if percentage_tolerance >= absolute:
+                return (percentage_tolerance, *percentage_rule)
+            return (absolute, *absolute_rule)
+    
+    return tolerance_for
+
+
+def _field_result(name: str, passed: bool, status: ComparisonStatus, expected: Any, actual: Any,
+                  reason: str, tolerance_applied: Optional[str] = None,
+                  expected_type: Optional[str] = None, actual_type: Optional[str] = None) -> FieldResult:
+    """Build a FieldResult without running pydantic validation.
+    
+    Every value the comparer produces already has the declared type, so the
+    instance is assembled directly, as model_construct would (but faster).
+    The status is stored by value to match use_enum_values, and the set
+    fields match what the equivalent keyword constructor call would record.
+    """
+    result = _new_object(FieldResult)
+    _set_attribute(result, '__dict__', {
+        'name': name,
+        'passed': passed,
+        'status': status.value,
+        'expected': expected,
+        'actual': actual,
+        'reason': reason,
+        'tolerance_applied': tolerance_applied,
+        'expected_type': expected_type,
+        'actual_type': actual_type,
+    })
+    fields_set = set(_REQUIRED_RESULT_FIELDS)
+    if tolerance_applied is not None:
+        fields_set.add('tolerance_applied')
+    if expected_type is not None:
+        fields_set.update(('expected_type', 'actual_type'))
+    _set_attribute(result, '__pydantic_fields_set__', fields_set)
+    _set_attribute(result, '__pydantic_extra__', None)
+    _set_attribute(result, '__pydantic_private__', None)
+    return result
+
+
+def _identical_item_result(name: str, expected: Any, actual: Any) -> FieldResult:
+    """Build the result for a list item that matches exactly."""
+    return _field_result(
+        name=name,
+        passed=True,
+        status=ComparisonStatus.IDENTICAL,
+        expected=expected,
+        actual=actual,
+        reason="Values match exactly"
+    )
+
+
+def _untoleranced_item_result(name: str, expected: Any, actual: Any, same: bool) -> FieldResult:
+    """Build the result for a numeric list item with no tolerance configured."""
+    if same:
+        return _identical_item_result(name, expected, actual)
+    return _field_result(
+        name=name,
+        passed=False,
+        status=ComparisonStatus.VALUE_MISMATCH,
+        expected=expected,
+        actual=actual,
+        reason=f"Value mismatch: expected {expected}, got {actual} (no tolerance configured)"
+    )
+
 
 class Comparer:
     """Main class for object comparison with tolerance settings."""
@@ -21,12 +188,48 @@ class Comparer:
     ):
         """Initialize the comparer.
         
+        Tolerance patterns are compiled at construction time, so the mapping
+        should not be mutated afterwards.
+        
         Args:
             tolerances: Dictionary mapping field paths to tolerance/field configs
             options: Global comparison options
         """
         self.tolerances = tolerances or {}
         self.options = options or ComparisonOptions()
+        self._has_configs = bool(self.tolerances)
+        
+        # Wildcard patterns compiled once, in configuration order
+        self._compiled_patterns = [
+            (*_literal_affixes(pattern), _compile_pattern(pattern), config)
+            for pattern, config in self.tolerances.items()
+            if '*' in pattern
+        ]
+        
+        # Interned child path per (parent path, dict key)
+        self._path_cache: Dict[Tuple[str, str], str] = {}
+        
+        # (ignore, required, text_validation) per FieldConfig, keyed by config identity
+        self._field_rules = {
+            id(config): (config.ignore, config.required, config.text_validation)
+            for config in self.tolerances.values()
+            if isinstance(config, FieldConfig)
+        }
+        self._has_text_validation = any(rule[2] for rule in self._field_rules.values())
+        
+        # Container handlers keyed by exact type
+        self._dispatch = {dict: self._compare_dicts, list: self._compare_lists}
+        
+        # Precompiled numeric check per ToleranceConfig, keyed by config identity
+        self._tolerance_checks = {}
+        for config in self.tolerances.values():
+            if isinstance(config, ToleranceConfig):
+                check = _make_tolerance_check(config)
+                if check is not None:
+                    self._tolerance_checks[id(config)] = check
+        
+        # Resolved config (or None) per visited path
+        self._config_cache: Dict[str, Optional[Union[ToleranceConfig, FieldConfig]]] = {}
     
     def compare(self, expected: Any, actual: Any) -> FullComparisonResult:
         """Compare two objects.
@@ -39,11 +242,9 @@ class Comparer:
             ComparisonResult with detailed comparison information
         """
         fields = []
-        all_passed = True
         
         # Start comparison at root level
-        result = self._compare_values("", expected, actual, fields)
-        all_passed = result.matches
+        all_passed = self._compare_values("", expected, actual, fields)
         
         result = FullComparisonResult(
             matches=all_passed,
@@ -56,46 +257,70 @@ class Comparer:
         
         return result
     
-    def _compare_values(self, path: str, expected: Any, actual: Any, fields: List[FieldResult]) -> FullComparisonResult:
-        """Compare two values at a specific path."""
+    def _compare_values(self, path: str, expected: Any, actual: Any, fields: List[FieldResult]) -> bool:
+        """Compare two values at a specific path, returning whether they match.
+        
+        Nested containers are walked with an explicit stack rather than by
+        recursion; fields are recorded in the same depth-first order.
+        """
+        all_passed = True
+        stack = [(path, expected, actual)]
+        pop = stack.pop
+        compare_node = self._compare_node
+        
+        while stack:
+            path, expected, actual = pop()
+            if not compare_node(path, expected, actual, fields, stack):
+                all_passed = False
+        
+        return all_passed
+    
+    def _compare_node(self, path: str, expected: Any, actual: Any, fields: List[FieldResult], stack: List) -> bool:
+        """Compare one node, pushing container children onto the stack."""
+        if actual is _MISSING:
+            return self._compare_missing_item(path, expected, fields)
+        
         # Check if this field should be ignored
-        field_config = self._get_field_config(path)
-        if field_config and hasattr(field_config, 'ignore') and field_config.ignore:
-            fields.append(FieldResult(
-                name=path or "root",
-                passed=True,
-                status=ComparisonStatus.IGNORED,
-                expected=expected,
-                actual=actual,
-                reason="Field configured to ignore"
-            ))
-            return FullComparisonResult(matches=True, summary="Field ignored", fields=[])
+        ignore, required, _ = self._get_field_rule(path)
+        if ignore:
+            if not self.options.only_failures:
+                fields.append(_field_result(
+                    name=path or "root",
+                    passed=True,
+                    status=ComparisonStatus.IGNORED,
+                    expected=expected,
+                    actual=actual,
+                    reason="Field configured to ignore"
+                ))
+            return True
         
         # Handle missing values
         if expected is None and actual is None:
-            fields.append(FieldResult(
-                name=path or "root",
-                passed=True,
-                status=ComparisonStatus.IDENTICAL,
-                expected=expected,
-                actual=actual,
-                reason="Both values are None"
-            ))
-            return FullComparisonResult(matches=True, summary="Both None", fields=[])
-        
-        if expected is None:
-            if field_config and hasattr(field_config, 'required') and not field_config.required:
-                fields.append(FieldResult(
+            if not self.options.only_failures:
+                fields.append(_field_result(
                     name=path or "root",
                     passed=True,
-                    status=ComparisonStatus.OPTIONAL_MISSING,
+                    status=ComparisonStatus.IDENTICAL,
                     expected=expected,
                     actual=actual,
-                    reason="Optional field missing in expected"
+                    reason="Both values are None"
                 ))
-                return FullComparisonResult(matches=True, summary="Optional field missing", fields=[])
+            return True
+        
+        if expected is None:
+            if not required:
+                if not self.options.only_failures:
+                    fields.append(_field_result(
+                        name=path or "root",
+                        passed=True,
+                        status=ComparisonStatus.OPTIONAL_MISSING,
+                        expected=expected,
+                        actual=actual,
+                        reason="Optional field missing in expected"
+                    ))
+                return True
             else:
-                fields.append(FieldResult(
+                fields.append(_field_result(
                     name=path or "root",
                     passed=False,
                     status=ComparisonStatus.MISSING_REQUIRED,
@@ -103,21 +328,22 @@ class Comparer:
                     actual=actual,
                     reason="Required field missing in expected"
                 ))
-                return FullComparisonResult(matches=False, summary="Required field missing", fields=[])
+                return False
         
         if actual is None:
-            if field_config and hasattr(field_config, 'required') and not field_config.required:
-                fields.append(FieldResult(
-                    name=path or "root",
-                    passed=True,
-                    status=ComparisonStatus.OPTIONAL_MISSING,
-                    expected=expected,
-                    actual=actual,
-                    reason="Optional field missing in actual"
-                ))
-                return FullComparisonResult(matches=True, summary="Optional field missing", fields=[])
+            if not required:
+                if not self.options.only_failures:
+                    fields.append(_field_result(
+                        name=path or "root",
+                        passed=True,
+                        status=ComparisonStatus.OPTIONAL_MISSING,
+                        expected=expected,
+                        actual=actual,
+                        reason="Optional field missing in actual"
+                    ))
+                return True
             else:
-                fields.append(FieldResult(
+                fields.append(_field_result(
                     name=path or "root",
                     passed=False,
                     status=ComparisonStatus.MISSING_REQUIRED,
@@ -125,52 +351,78 @@ class Comparer:
                     actual=actual,
                     reason="Required field missing in actual"
                 ))
-                return FullComparisonResult(matches=False, summary="Required field missing", fields=[])
-        
-        # Type checking
-        if not self._types_compatible(expected, actual):
-            fields.append(FieldResult(
+                return False
+        
+        expected_type = type(expected)
+        if expected_type is type(actual):
+            # Same exact type: dispatch without any isinstance checks
+            if expected is actual and expected_type in _IDENTITY_TYPES:
+                # The same immutable leaf object on both sides matches without further checks
+                if not self.options.only_failures:
+                    fields.append(_field_result(
+                        name=path or "root",
+                        passed=True,
+                        status=ComparisonStatus.IDENTICAL,
+                        expected=expected,
+                        actual=actual,
+                        reason="Values match exactly"
+                    ))
+                return True
+            handler = self._dispatch.get(expected_type)
+            if handler is not None:
+                return handler(path, expected, actual, fields, stack)
+            if expected_type in _PRIMITIVE_TYPES:
+                return self._compare_primitives(path, expected, actual, fields)
+        elif not self._types_compatible(expected, actual):
+            fields.append(_field_result(
                 name=path or "root",
                 passed=False,
                 status=ComparisonStatus.TYPE_MISMATCH,
                 expected=expected,
                 actual=actual,
-                reason=f"Type mismatch: expected {type(expected).__name__}, got {type(actual).__name__}",
-                expected_type=type(expected).__name__,
+                reason=f"Type mismatch: expected {expected_type.__name__}, got {type(actual).__name__}",
+                expected_type=expected_type.__name__,
                 actual_type=type(actual).__name__
             ))
-            return FullComparisonResult(matches=False, summary="Type mismatch", fields=[])
+            return False
         
-        # Handle different data types
+        # Subclasses of the container types and any other values
         if isinstance(expected, dict) and isinstance(actual, dict):
-            return self._compare_dicts(path, expected, actual, fields)
+            return self._compare_dicts(path, expected, actual, fields, stack)
         elif isinstance(expected, list) and isinstance(actual, list):
-            return self._compare_lists(path, expected, actual, fields)
+            return self._compare_lists(path, expected, actual, fields, stack)
         else:
             return self._compare_primitives(path, expected, actual, fields)
     
-    def _compare_dicts(self, path: str, expected: Dict, actual: Dict, fields: List[FieldResult]) -> FullComparisonResult:
-        """Compare two dictionaries."""
-        all_passed = True
-        all_keys = set(expected.keys()) | set(actual.keys())
-        
-        for key in all_keys:
-            key_path = f"{path}.{key}" if path else key
-            exp_value = expected.get(key)
-            act_value = actual.get(key)
-            
-            result = self._compare_values(key_path, exp_value, act_value, fields)
-            if not result.matches:
-                all_passed = False
+    def _compare_dicts(self, path: str, expected: Dict, actual: Dict, fields: List[FieldResult], stack: List) -> bool:
+        """Queue the entries of two dictionaries for comparison.
         
-        return FullComparisonResult(matches=all_passed, summary="Dict comparison", fields=[])
+        Keys are compared in the expected dict's order, followed by any keys
+        only present in actual.
+        """
+        all_keys = list(expected)
+        if expected.keys() != actual.keys():
+            all_keys.extend(key for key in actual if key not in expected)
+        
+        children = [
+            (self._child_path(path, key), expected.get(key), actual.get(key))
+            for key in all_keys
+        ]
+        # Reversed so the stack pops them in key order
+        children.reverse()
+        stack.extend(children)
+        return True
     
-    def _compare_lists(self, path: str, expected: List, actual: List, fields: List[FieldResult]) -> FullComparisonResult:
-        """Compare two lists."""
+    def _compare_lists(self, path: str, expected: List, actual: List, fields: List[FieldResult], stack: List) -> bool:
+        """Compare two lists, queueing their items for comparison.
+        
+        Items missing from actual are queued after the shared items so they are
+        reported once those have been compared.
+        """
         all_passed = True
         
         if len(expected) != len(actual):
-            fields.append(FieldResult(
+            fields.append(_field_result(
                 name=f"{path}.length" if path else "length",
                 passed=False,
                 status=ComparisonStatus.ARRAY_LENGTH_MISMATCH,
@@ -180,78 +432,181 @@ class Comparer:
             ))
             all_passed = False
         
+        children = []
+        
         # Compare items up to the minimum length
         min_length = min(len(expected), len(actual))
-        for i in range(min_length):
-            item_path = f"{path}[{i}]" if path else f"[{i}]"
-            result = self._compare_values(item_path, expected[i], actual[i], fields)
-            if not result.matches:
+        expected_items = expected if len(expected) == min_length else expected[:min_length]
+        actual_items = actual if len(actual) == min_length else actual[:min_length]
+        if (min_length >= _VECTORIZE_MIN_LENGTH and _numpy() is not None
+                and self._is_vectorizable(expected_items, actual_items)):
+            if not self._compare_numeric_lists(path, expected_items, actual_items, fields):
                 all_passed = False
+        else:
+            children.extend(
+                (path + _index_str(i), exp_item, act_item)
+                for i, (exp_item, act_item) in enumerate(zip(expected_items, actual_items))
+            )
         
         # Handle missing items in actual list
-        if len(actual) < len(expected):
-            for i in range(len(actual), len(expected)):
-                item_path = f"{path}[{i}]" if path else f"[{i}]"
-                # Check if there are field configurations for this item
-                field_config = self._get_field_config(item_path)
-                if field_config and hasattr(field_config, 'required') and not field_config.required:
-                    # Optional field, mark as missing but passed
-                    fields.append(FieldResult(
-                        name=item_path,
-                        passed=True,
-                        status=ComparisonStatus.OPTIONAL_MISSING,
-                        expected=expected[i],
-                        actual=None,
-                        reason="Optional field missing"
-                    ))
-                else:
-                    # Required field, mark as failed
-                    fields.append(FieldResult(
-                        name=item_path,
-                        passed=False,
-                        status=ComparisonStatus.MISSING_REQUIRED,
-                        expected=expected[i],
-                        actual=None,
-                        reason="Required field missing"
-                    ))
-                    all_passed = False
+        children.extend(
+            (path + _index_str(i), expected[i], _MISSING)
+            for i in range(len(actual), len(expected))
+        )
+        
+        # Reversed so the stack pops them in index order
+        children.reverse()
+        stack.extend(children)
+        return all_passed
+    
+    def _compare_missing_item(self, path: str, expected: Any, fields: List[FieldResult]) -> bool:
+        """Record a list item that is missing from the actual list."""
+        # Check if there are field configurations for this item
+        if not self._get_field_rule(path)[1]:
+            # Optional field, mark as missing but passed
+            if not self.options.only_failures:
+                fields.append(_field_result(
+                    name=path,
+                    passed=True,
+                    status=ComparisonStatus.OPTIONAL_MISSING,
+                    expected=expected,
+                    actual=None,
+                    reason="Optional field missing"
+                ))
+            return True
         
-        return FullComparisonResult(matches=all_passed, summary="List comparison", fields=[])
+        # Required field, mark as failed
+        fields.append(_field_result(
+            name=path,
+            passed=False,
+            status=ComparisonStatus.MISSING_REQUIRED,
+            expected=expected,
+            actual=None,
+            reason="Required field missing"
+        ))
+        return False
     
-    def _compare_primitives(self, path: str, expected: Any, actual: Any, fields: List[FieldResult]) -> FullComparisonResult:
+    def _compare_numeric_lists(self, path: str, expected: List[float], actual: List[float], fields: List[FieldResult]) -> bool:
+        """Compare two equal-length numeric lists with vectorized tolerance math.
+        
+        Produces the same per-item fields as the element-by-element path. Falls
+        back to that path when items resolve to different configs or to a
+        FieldConfig.
+        """
+        item_paths = [path + _index_str(i) for i in range(len(expected))]
+        configs = {id(config): config for config in map(self._get_field_config, item_paths)}
+        config = configs.popitem()[1] if len(configs) == 1 else None
+        if configs or isinstance(config, FieldConfig):
+            all_passed = True
+            for item_path, exp_item, act_item in zip(item_paths, expected, actual):
+                if not self._compare_values(item_path, exp_item, act_item, fields):
+                    all_passed = False
+            return all_passed
+        
+        np = _numpy()
+        exp = np.array(expected, dtype=np.float64)
+        act = np.array(actual, dtype=np.float64)
+        identical_mask = exp == act
+        identical = identical_mask.tolist()
+        
+        if id(config) not in self._tolerance_checks or identical_mask.all():
+            # No tolerance math needed: identical items match, anything else is a mismatch
+            items = zip(item_paths, expected, actual, identical)
+            if self.options.only_failures:
+                items = (item for item in items if not item[3])
+            fields.extend(_untoleranced_item_result(*item) for item in items)
+            return all(identical)
+        
+        # Same arithmetic, in the same order, as _make_tolerance_check
+        percentage_type = f"{config.percentage}%"
+        absolute_type = f"{config.absolute} absolute"
+        within_reasons = {
+            True: f"Within tolerance ({percentage_type})",
+            False: f"Within tolerance ({absolute_type})",
+        }
+        with np.errstate(invalid='ignore', over='ignore'):
+            if config.percentage is None:
+                tolerances = np.full(exp.shape, config.absolute, dtype=np.float64)
+                uses_percentage = np.zeros(exp.shape, dtype=bool)
+            else:
+                tolerances = np.abs(exp * config.percentage / 100.0)
+                if config.absolute is None:
+                    uses_percentage = np.ones(exp.shape, dtype=bool)
+                else:
+                    uses_percentage = tolerances >= config.absolute
+                    tolerances = np.where(uses_percentage, tolerances, config.absolute)
+            differences = np.abs(exp - act)
+            within = (differences <= tolerances).tolist()
+        
+        def toleranced_item_result(item_path, exp_item, act_item, same, ok, difference, tolerance, by_percentage):
+            if same:
+                return _identical_item_result(item_path, exp_item, act_item)
+            tolerance_type = percentage_type if by_percentage else absolute_type
+            if ok:
+                return _field_result(
+                    name=item_path,
+                    passed=True,
+                    status=ComparisonStatus.IN_TOLERANCE,
+                    expected=exp_item,
+                    actual=act_item,
+                    reason=within_reasons[by_percentage],
+                    tolerance_applied=tolerance_type
+                )
+            return _field_result(
+                name=item_path,
+                passed=False,
+                status=ComparisonStatus.OUTSIDE_TOLERANCE,
+                expected=exp_item,
+                actual=act_item,
+                reason=f"Outside tolerance ({tolerance_type}): difference {difference:.2f} > tolerance {tolerance:.2f}",
+                tolerance_applied=tolerance_type
+            )
+        
+        items = zip(item_paths, expected, actual, identical, within,
+                    differences.tolist(), tolerances.tolist(), uses_percentage.tolist())
+        if self.options.only_failures:
+            items = (item for item in items if not (item[3] or item[4]))
+        fields.extend(toleranced_item_result(*item) for item in items)
+        return all(same or ok for same, ok in zip(identical, within))
+    
+    def _compare_primitives(self, path: str, expected: Any, actual: Any, fields: List[FieldResult]) -> bool:
         """Compare primitive values (numbers, strings, booleans)."""
         # Check for exact match first
         if expected == actual:
-            fields.append(FieldResult(
-                name=path or "root",
-                passed=True,
-                status=ComparisonStatus.IDENTICAL,
-                expected=expected,
-                actual=actual,
-                reason="Values match exactly"
-            ))
-            return FullComparisonResult(matches=True, summary="Exact match", fields=[])
+            if not self.options.only_failures:
+                fields.append(_field_result(
+                    name=path or "root",
+                    passed=True,
+                    status=ComparisonStatus.IDENTICAL,
+                    expected=expected,
+                    actual=actual,
+                    reason="Values match exactly"
+                ))
+            return True
+        
+        # Two differing strings (the common leaf) can skip the numeric checks
+        both_str = type(expected) is str and type(actual) is str
         
         # Check if this is a numerical comparison with tolerance
-        if self._is_numerical(expected) and self._is_numerical(actual):
+        if not both_str and self._is_numerical(expected) and self._is_numerical(actual):
             return self._compare_numerical_with_tolerance(path, expected, actual, fields)
         
         # Check for text validation
-        field_config = self._get_field_config(path)
-        if field_config and hasattr(field_config, 'text_validation') and field_config.text_validation:
+        if self._has_text_validation and self._get_field_rule(path)[2]:
             # For text validation, only check that actual is not empty
             if actual and str(actual).strip():
-                fields.append(FieldResult(
-                    name=path or "root",
-                    passed=True,
-                    status=ComparisonStatus.IN_TOLERANCE,
-                    expected=expected,
-                    actual=actual,
-                    reason="Text validation passed (non-empty)"
-                ))
-                return FullComparisonResult(matches=True, summary="Text validation passed", fields=[])
+                if not self.options.only_failures:
+                    fields.append(_field_result(
+                        name=path or "root",
+                        passed=True,
+                        status=ComparisonStatus.IN_TOLERANCE,
+                        expected=expected,
+                        actual=actual,
+                        reason="Text validation passed (non-empty)"
+                    ))
+                return True
             else:
-                fields.append(FieldResult(
+                fields.append(_field_result(
                     name=path or "root",
                     passed=False,
                     status=ComparisonStatus.OUTSIDE_TOLERANCE,
@@ -259,10 +614,10 @@ class Comparer:
                     actual=actual,
                     reason="Text validation failed (empty or None)"
                 ))
-                return FullComparisonResult(matches=False, summary="Text validation failed", fields=[])
+                return False
         
         # Default: exact match required
-        fields.append(FieldResult(
+        fields.append(_field_result(
             name=path or "root",
             passed=False,
             status=ComparisonStatus.VALUE_MISMATCH,
@@ -270,15 +625,15 @@ class Comparer:
             actual=actual,
             reason=f"Value mismatch: expected {expected}, got {actual}"
         ))
-        return FullComparisonResult(matches=False, summary="Value mismatch", fields=[])
+        return False
     
-    def _compare_numerical_with_tolerance(self, path: str, expected: float, actual: float, fields: List[FieldResult]) -> FullComparisonResult:
+    def _compare_numerical_with_tolerance(self, path: str, expected: float, actual: float, fields: List[FieldResult]) -> bool:
         """Compare numerical values with tolerance settings."""
-        field_config = self._get_field_config(path)
+        tolerance_for = self._tolerance_checks.get(id(self._get_field_config(path)))
         
-        if not field_config or not isinstance(field_config, ToleranceConfig):
+        if tolerance_for is None:
             # No tolerance configured, require exact match
-            fields.append(FieldResult(
+            fields.append(_field_result(
                 name=path or "root",
                 passed=False,
                 status=ComparisonStatus.VALUE_MISMATCH,
@@ -286,63 +641,26 @@ class Comparer:
                 actual=actual,
                 reason=f"Value mismatch: expected {expected}, got {actual} (no tolerance configured)"
             ))
-            return FullComparisonResult(matches=False, summary="Value mismatch", fields=[])
-        
-        # Calculate tolerances
-        percentage_tolerance = None
-        absolute_tolerance = None
-        
-        if hasattr(field_config, 'percentage') and field_config.percentage is not None:
-            percentage_tolerance = abs(expected * field_config.percentage / 100.0)
-        
-        if hasattr(field_config, 'absolute') and field_config.absolute is not None:
-            absolute_tolerance = field_config.absolute
-        
-        # Determine which tolerance to use (whichever is greater)
-        tolerance = None
-        tolerance_type = None
+            return False
         
-        if percentage_tolerance is not None and absolute_tolerance is not None:
-            if percentage_tolerance >= absolute_tolerance:
-                tolerance = percentage_tolerance
-                tolerance_type = f"{field_config.percentage}%" if hasattr(field_config, 'percentage') else "percentage"
-            else:
-                tolerance = absolute_tolerance
-                tolerance_type = f"{field_config.absolute} absolute" if hasattr(field_config, 'absolute') else "absolute"
-        elif percentage_tolerance is not None:
-            tolerance = percentage_tolerance
-            tolerance_type = f"{field_config.percentage}%"
-        elif absolute_tolerance is not None:
-            tolerance = absolute_tolerance
-            tolerance_type = f"{field_config.absolute} absolute"
-        
-        if tolerance is None:
-            # No tolerance configured
-            fields.append(FieldResult(
-                name=path or "root",
-                passed=False,
-                status=ComparisonStatus.VALUE_MISMATCH,
-                expected=expected,
-                actual=actual,
-                reason=f"Value mismatch: expected {expected}, got {actual} (no tolerance configured)"
-            ))
-            return FullComparisonResult(matches=False, summary="Value mismatch", fields=[])
+        tolerance, tolerance_type, within_reason = tolerance_for(expected)
         
         # Check if within tolerance
         difference = abs(expected - actual)
         if difference <= tolerance:
-            fields.append(FieldResult(
-                name=path or "root",
-                passed=True,
-                status=ComparisonStatus.IN_TOLERANCE,
-                expected=expected,
-                actual=actual,
-                reason=f"Within tolerance ({tolerance_type})",
-                tolerance_applied=tolerance_type
-            ))
-            return FullComparisonResult(matches=True, summary="Within tolerance", fields=[])
+            if not self.options.only_failures:
+                fields.append(_field_result(
+                    name=path or "root",
+                    passed=True,
+                    status=ComparisonStatus.IN_TOLERANCE,
+                    expected=expected,
+                    actual=actual,
+                    reason=within_reason,
+                    tolerance_applied=tolerance_type
+                ))
+            return True
         else:
-            fields.append(FieldResult(
+            fields.append(_field_result(
                 name=path or "root",
                 passed=False,
                 status=ComparisonStatus.OUTSIDE_TOLERANCE,
@@ -351,33 +669,54 @@ class Comparer:
                 reason=f"Outside tolerance ({tolerance_type}): difference {difference:.2f} > tolerance {tolerance:.2f}",
                 tolerance_applied=tolerance_type
             ))
-            return FullComparisonResult(matches=False, summary="Outside tolerance", fields=[])
+            return False
+    
+    def _child_path(self, path: str, key: Any) -> str:
+        """Get the interned path of a dict entry, reusing it across compares."""
+        if type(key) is not str:
+            # Non-string keys like 1 and True hash alike, so don't share entries
+            return f"{path}.{key}" if path else str(key)
+        cache_key = (path, key)
+        child = self._path_cache.get(cache_key)
+        if child is None:
+            child = sys.intern(f"{path}.{key}" if path else key)
+            if len(self._path_cache) >= _CONFIG_CACHE_SIZE:
+                self._path_cache.clear()
+            self._path_cache[cache_key] = child
+        return child
+    
+    def _get_field_rule(self, path: str) -> Tuple[bool, bool, bool]:
+        """Get the (ignore, required, text_validation) flags that apply at a path."""
+        if not self._field_rules:
+            # Only tolerances are configured, so every path gets the defaults
+            return _DEFAULT_FIELD_RULE
+        return self._field_rules.get(id(self._get_field_config(path)), _DEFAULT_FIELD_RULE)
     
     def _get_field_config(self, path: str) -> Optional[Union[ToleranceConfig, FieldConfig]]:
         """Get field configuration for a given path."""
-        # Direct match first
-        if path in self.tolerances:
-            return self.tolerances[path]
+        if not self._has_configs:
+            return None
         
-        # Try wildcard matching
-        for pattern, config in self.tolerances.items():
-            if self._path_matches_pattern(path, pattern):
-                return config
+        cached = self._config_cache.get(path, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
-        return None
-    
-    def _path_matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if a field path matches a pattern with wildcards."""
-        # Convert pattern to regex
-        # First escape all dots
-        regex_pattern = pattern.replace('.', r'\.')
-        # Then replace \.* with .* for wildcard matching
-        regex_pattern = regex_pattern.replace(r'\.*', '.*')
-        
-        try:
-            return bool(re.match(f"^{regex_pattern}$", path))
-        except re.error:
-            return False
+        # Direct match first
+        if path in self.tolerances:
+            config = self.tolerances[path]
+        else:
+            # Try wildcard matching
+            config = None
+            # Cheap literal prefix/suffix checks rule out most patterns before the regex
+            for prefix, suffix, regex, pattern_config in self._compiled_patterns:
+                if path.startswith(prefix) and path.endswith(suffix) and regex.match(path):
+                    config = pattern_config
+                    break
+        
+        if len(self._config_cache) >= _CONFIG_CACHE_SIZE:
+            self._config_cache.clear()
+        self._config_cache[path] = config
+        return config
     
     def _types_compatible(self, expected: Any, actual: Any) -> bool:
         """Check if two values have compatible types."""
@@ -396,6 +735,26 @@ class Comparer:
         
         return False
     
+    def _is_vectorizable(self, expected: List[Any], actual: List[Any]) -> bool:
+        """Check if two equal-length lists can be compared as float64 arrays.
+        
+        Items must be floats or ints that convert exactly, and each pair must
+        share a type unless normalize_types allows int/float mixing.
+        """
+        if not (self._is_exact_numeric_list(expected) and self._is_exact_numeric_list(actual)):
+            return False
+        if self.options.normalize_types:
+            return True
+        return all(type(exp_item) is type(act_item) for exp_item, act_item in zip(expected, actual))
+    
+    def _is_exact_numeric_list(self, values: List[Any]) -> bool:
+        """Check if every item is a float or an int that float64 holds exactly."""
+        return all(
+            type(value) is float
+            or (type(value) is int and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT)
+            for value in values
+        )
+    
     def _is_numerical(self, value: Any) -> bool:
         """Check if a value is numerical."""
         return isinstance(value, (int, float)) and not isinstance(value, bool)
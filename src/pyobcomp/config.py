@@ -2,11 +2,16 @@
 Configuration models for PyObComp.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, Union
 from enum import Enum
 
 
+# Per-instance __dict__ is dropped where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class ComparisonStatus(Enum):
     """Status levels for field comparisons."""
     # Pass states
@@ -24,7 +29,7 @@ class ComparisonStatus(Enum):
     ARRAY_LENGTH_MISMATCH = "array_length_mismatch"  # Array length differs
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ToleranceConfig:
     """Configuration for numerical tolerance settings."""
     percentage: Optional[float] = None
@@ -39,7 +44,7 @@ class ToleranceConfig:
             raise ValueError("Absolute tolerance must be non-negative")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FieldConfig:
     """Configuration for field behavior settings."""
     required: bool = True
@@ -53,13 +58,16 @@ class FieldConfig:
             raise ValueError("Field cannot be both ignored and required")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ComparisonOptions:
     """Global options for object comparison."""
     normalize_types: bool = False
+    # Reuse results for repeated compares of the same (unmutated) objects
+    enable_identity_cache: bool = False
+    cache_size: int = 128
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Field:
     """Result of a single field comparison."""
     name: str
@@ -73,7 +81,7 @@ class Field:
     actual_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ComparisonResult:
     """Result of an object comparison."""
     matches: bool
@@ -5,47 +5,89 @@ This module provides factory methods to create Comparer instances from
 YAML files, CompareProfile objects, or other sources.
 """
 
-import yaml
-from typing import Union, Dict, Any
+import functools
+import json
+import sys
+from typing import Union, Dict, Any, Tuple
 from pathlib import Path
 
 from .models import CompareProfile, FieldSettings, ComparisonOptions, ToleranceConfig, FieldConfig
 
 
+@functools.lru_cache(maxsize=32)
+def _load_profile_data(file_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML (or .json) profile, cached per path, modification time and size.
+    
+    The returned data is shared between callers and must not be mutated.
+    """
+    # Bytes let libyaml and json detect the encoding and decode without a Python text layer
+    with open(file_path, 'rb') as f:
+        if file_path.endswith('.json'):
+            # JSON is a subset of YAML, and the json module parses it much faster
+            return json.load(f)
+        
+        # Imported on first use so profiles built in code never load PyYAML
+        import yaml
+        # CSafeLoader is missing when PyYAML is built without libyaml
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _file_cache_key(file_path: Union[str, Path]) -> Tuple[str, int, int]:
+    """Get the (resolved path, mtime_ns, size) key profile file caches use."""
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    
+    file_path = file_path.resolve()
+    stat = file_path.stat()
+    return str(file_path), stat.st_mtime_ns, stat.st_size
+
+
 class ComparerFactory:
     """Factory for creating Comparer instances."""
     
     @staticmethod
-    def load_profile(file_path: Union[str, Path]) -> CompareProfile:
+    def load_profile(file_path: Union[str, Path], validate: bool = True) -> CompareProfile:
         """Load a CompareProfile from a YAML file.
         
+        Files ending in .json are parsed as JSON, which is faster to load
+        for large, machine-generated profiles. Parsed file contents are
+        cached until the file's modification time or size changes; each call
+        still returns a newly built profile.
+        
         Args:
             file_path: Path to YAML configuration file
+            validate: Run full pydantic validation on field settings. Pass
+                False for trusted profiles to skip type coercion; conflicting
+                settings are still rejected.
             
         Returns:
             CompareProfile instance
         """
-        file_path = Path(file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        # Profiles are validated on every call so callers always get their own copy
+        config_data = _load_profile_data(*_file_cache_key(file_path))
         
-        with open(file_path, 'r') as f:
-            config_data = yaml.safe_load(f)
-        
-        return ComparerFactory._parse_config_data(config_data)
+        return ComparerFactory._parse_config_data(config_data, validate)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached profile file data."""
+        _load_profile_data.cache_clear()
     
     @staticmethod
     def create_from_file(file_path: Union[str, Path]):
         """Create a Comparer directly from a YAML file.
         
+        The parsed file contents are cached like load_profile's, but each
+        call builds a new Comparer with its own options.
+        
         Args:
             file_path: Path to YAML configuration file
             
         Returns:
             Comparer instance
         """
-        profile = ComparerFactory.load_profile(file_path)
-        return ComparerFactory.create(profile)
+        return ComparerFactory.create(ComparerFactory.load_profile(file_path))
     
     @staticmethod
     def create(profile: CompareProfile):
@@ -63,38 +105,41 @@ class ComparerFactory:
         # Use profile options
         options = profile.options
         
-        # Convert CompareProfile to the format expected by Comparer
+        # Convert CompareProfile to the format expected by Comparer. FieldSettings
+        # already enforces valid combinations, so configs are built without
+        # running validation again.
         tolerances = {}
         for field_path, field_settings in profile.fields.items():
-            if field_settings.percentage is not None or field_settings.absolute is not None:
-                # Tolerance configuration - only pass non-None values
-                tolerance_kwargs = {}
-                if field_settings.percentage is not None:
-                    tolerance_kwargs['percentage'] = field_settings.percentage
-                if field_settings.absolute is not None:
-                    tolerance_kwargs['absolute'] = field_settings.absolute
-                tolerances[field_path] = ToleranceConfig(**tolerance_kwargs)
+            # Interned like the Comparer's own paths, so exact lookups match by identity
+            field_path = sys.intern(field_path)
+            percentage = field_settings.percentage
+            absolute = field_settings.absolute
+            if percentage is not None or absolute is not None:
+                tolerances[field_path] = ToleranceConfig.model_construct(percentage=percentage, absolute=absolute)
             else:
                 # Field configuration - use defaults for unspecified values
-                # If ignore or text_validation is True, set required to False to avoid validation conflict
-                required_default = True
-                if field_settings.ignore is True or field_settings.text_validation is True:
-                    required_default = False
-                
-                tolerances[field_path] = FieldConfig(
-                    required=field_settings.required if field_settings.required is not None else required_default,
-                    ignore=field_settings.ignore if field_settings.ignore is not None else False,
-                    text_validation=field_settings.text_validation if field_settings.text_validation is not None else False
+                # If ignore or text_validation is True, required defaults to False to avoid a conflict.
+                # Truthiness, not identity: profiles loaded with validate=False keep
+                # raw YAML values such as 1 or 0
+                ignore = bool(field_settings.ignore)
+                text_validation = bool(field_settings.text_validation)
+                required = field_settings.required
+                tolerances[field_path] = FieldConfig.model_construct(
+                    required=not (ignore or text_validation) if required is None else bool(required),
+                    ignore=ignore,
+                    text_validation=text_validation
                 )
         
         return Comparer(tolerances=tolerances, options=options)
     
     @staticmethod
-    def _parse_config_data(config_data: Dict[str, Any]) -> CompareProfile:
+    def _parse_config_data(config_data: Dict[str, Any], validate: bool = True) -> CompareProfile:
         """Parse raw YAML data into a CompareProfile.
         
         Args:
             config_data: Raw YAML data
+            validate: Validate field settings with pydantic; when False they are
+                constructed directly and only checked for conflicting settings
             
         Returns:
             CompareProfile instance
@@ -107,6 +152,11 @@ class ComparerFactory:
             if config_data is None:
                 config_data = {}
             
+            # Validating mappings directly skips BaseModel.__init__ and kwargs copying.
+            # Looked up per call because the models build their validators lazily.
+            validate_field_settings = FieldSettings.__pydantic_validator__.validate_python
+            validate_options = ComparisonOptions.__pydantic_validator__.validate_python
+            
             fields = {}
             if 'fields' in config_data and config_data['fields']:
                 for field_path, field_config in config_data['fields'].items():
@@ -115,12 +165,20 @@ class ComparerFactory:
                        field_config.get('percentage') is None and field_config.get('absolute') is None:
                         raise ValueError("At least one tolerance (percentage or absolute) must be specified")
                     
-                    fields[field_path] = FieldSettings(**field_config)
+                    if validate:
+                        fields[field_path] = validate_field_settings(field_config)
+                    else:
+                        field_settings = FieldSettings.model_construct(**field_config)
+                        field_settings.validate_field_settings()
+                        fields[field_path] = field_settings
             
+            # Options are always validated: they hold the nested logging config
             options = ComparisonOptions()
             if 'options' in config_data and config_data['options']:
-                options = ComparisonOptions(**config_data['options'])
+                options = validate_options(config_data['options'])
             
+            if not validate:
+                return CompareProfile.model_construct(fields=fields, options=options)
             return CompareProfile(fields=fields, options=options)
         except Exception as e:
             raise ValueError(f"Invalid YAML configuration: {e}") from e
@@ -128,9 +186,9 @@ class ComparerFactory:
 
 
 # Convenience functions for module-level usage
-def load_profile(file_path: Union[str, Path]) -> CompareProfile:
+def load_profile(file_path: Union[str, Path], validate: bool = True) -> CompareProfile:
     """Load a CompareProfile from a YAML file."""
-    return ComparerFactory.load_profile(file_path)
+    return ComparerFactory.load_profile(file_path, validate)
 
 
 def create_from_file(file_path: Union[str, Path]):
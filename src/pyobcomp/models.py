@@ -6,17 +6,33 @@ on the comparison logic to avoid circular imports.
 """
 
 from typing import Dict, Any, Optional, List, Union, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from enum import Enum
+from types import MappingProxyType
+import functools
 import logging
 import hashlib
 import json
 import random
+import re
 import string
 from collections import deque
 from collections import deque
 
 
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    """Escape one character as json.dumps does with ensure_ascii."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+    # Characters outside the BMP become a UTF-16 surrogate pair
+    code -= 0x10000
+    return f'\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}'
+
+
 # Class-level cache to track which comparison profiles have been logged
 # Using deque with maxlen=100 to automatically remove oldest entries and prevent memory leaks
 _logged_profiles: deque = deque(maxlen=100)  # deque of (profile_hash, profile_yaml) tuples
@@ -32,12 +48,22 @@ def _get_profile_hash(tolerances: Dict) -> str:
         return "unknown"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
+    """Return the named logger, skipping logging's locked registry lookup.
+    
+    Loggers are never removed from the registry, so a cached instance
+    stays the one logging.getLogger would return.
+    """
+    return logging.getLogger(name)
+
+
 def _generate_comparison_id() -> str:
     """Generate a short random ID for correlating comparison outputs."""
     return ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
 
 
-class ComparisonStatus(Enum):
+class ComparisonStatus(str, Enum):
     """Status levels for field comparisons."""
     # Pass states
     IDENTICAL = "identical"           # Exact match
@@ -56,36 +82,31 @@ class ComparisonStatus(Enum):
 
 class ToleranceConfig(BaseModel):
     """Configuration for numerical tolerance settings."""
+    model_config = ConfigDict(defer_build=True)
+    
     percentage: Optional[float] = Field(None, ge=0, description="Percentage tolerance (0-100)")
     absolute: Optional[float] = Field(None, ge=0, description="Absolute tolerance")
     
-    @field_validator('percentage', 'absolute')
-    @classmethod
-    def at_least_one_tolerance(cls, v, info):
-        if v is None and not any(info.data.values()):
+    @model_validator(mode='after')
+    def at_least_one_tolerance(self):
+        if self.percentage is None and self.absolute is None:
             raise ValueError("At least one tolerance (percentage or absolute) must be specified")
-        return v
+        return self
 
 
 class FieldConfig(BaseModel):
     """Configuration for field behavior settings."""
+    model_config = ConfigDict(defer_build=True)
+    
     required: bool = Field(True, description="Field must be present and match exactly")
     ignore: bool = Field(False, description="Skip field entirely during comparison")
     text_validation: bool = Field(False, description="Only check that field is not empty")
     
-    @field_validator('ignore', 'text_validation')
-    @classmethod
-    def mutually_exclusive_with_required(cls, v, info):
-        if v and info.data.get('required', True):
+    @model_validator(mode='after')
+    def mutually_exclusive_with_required(self):
+        if (self.ignore or self.text_validation) and self.required:
             raise ValueError("Field cannot be both ignored/text-validated and required")
-        return v
-    
-    @field_validator('ignore', 'text_validation')
-    @classmethod
-    def mutually_exclusive_with_each_other(cls, v, info):
-        if v and info.data.get('text_validation', False):
-            raise ValueError("Field cannot be both ignored and text-validated")
-        return v
+        return self
 
 
 class LoggingDetail(str, Enum):
@@ -103,6 +124,8 @@ class LoggingFormat(str, Enum):
 
 class LoggingConfig(BaseModel):
     """Configuration for comparison logging."""
+    model_config = ConfigDict(defer_build=True)
+    
     enabled: Optional[bool] = Field(None, description="Enable logging (None=auto-detect from logger, True/False=explicit)")
     when: Literal["never", "always", "on_fail"] = Field("on_fail", description="When to log comparisons")
     detail: LoggingDetail = Field(LoggingDetail.FAILURES, description="Level of detail to log")
@@ -113,13 +136,18 @@ class LoggingConfig(BaseModel):
 
 class ComparisonOptions(BaseModel):
     """Global options for object comparison."""
+    model_config = ConfigDict(defer_build=True)
+    
     normalize_types: bool = Field(False, description="Handle int/float differences (9 vs 9.0)")
+    only_failures: bool = Field(False, description="Only record results for fields that failed")
     logging: LoggingConfig = Field(default_factory=LoggingConfig, description="Logging configuration")
 
 
 class FieldResult(BaseModel):
     """Result of a single field comparison."""
-    model_config = ConfigDict(use_enum_values=True)
+    # use_enum_values keeps status a plain string, so model_dump() output is
+    # unchanged for code that built FieldResults with enum members
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
     
     name: str = Field(..., description="Field path (e.g., 'items[0].nutrition.calories')")
     passed: bool = Field(..., description="Simple pass/fail boolean")
@@ -132,9 +160,60 @@ class FieldResult(BaseModel):
     actual_type: Optional[str] = Field(None, description="Actual value type")
 
 
+# format_table layout and the simpler status names it displays
+_TABLE_HEADER = "Field Name                      | Status     | Expected | Actual   | Reason"
+_TABLE_SEPARATOR = "-" * len(_TABLE_HEADER)
+_SIMPLE_STATUS_MAP = MappingProxyType({
+    'identical': 'match',
+    'in_tolerance': 'tolerated',
+    'outside_tolerance': 'fail',
+    'type_mismatch': 'fail',
+    'missing_required': 'fail',
+    'optional_missing': 'tolerated',
+    'value_mismatch': 'fail',
+    'object_missing': 'fail',
+    'array_length_mismatch': 'fail',
+    'ignored': 'ignored'
+})
+# Short table reason for statuses whose reason column doesn't depend on the field
+_SHORT_REASONS = MappingProxyType({
+    'identical': 'exact',
+    'type_mismatch': 'type',
+    'missing_required': 'missing',
+    'optional_missing': 'optional',
+    'value_mismatch': 'exact',
+    'object_missing': 'missing',
+    'array_length_mismatch': 'length',
+    'ignored': 'ignored'
+})
+# (prefix when a tolerance was applied, text when none was) for tolerance statuses
+_TOLERANCE_SHORT_REASONS = MappingProxyType({
+    'in_tolerance': ('< ', 'tolerated'),
+    'outside_tolerance': ('> ', 'failed')
+})
+# Columns: field name (30), simple status (10), expected (8), actual (8), short reason
+_TABLE_ROW = "{:<30} | {:<10} | {:<8} | {:<8} | {}".format
+
+
+def _truncate_cell(value: Any) -> str:
+    """Render a value for an 8-character table column, truncating long text."""
+    text = str(value)
+    return text if len(text) <= 8 else text[:8] + "..."
+
+
+def _truncate_field_name(name: str) -> str:
+    """Fit a field path in the 30-character column, keeping its last 27 chars."""
+    return name if len(name) <= 30 else "..." + name[-(30-3):]
+
+
+# Statuses hidden by format_table's 'failures' and 'differences' detail levels
+_TABLE_PASSING_STATUSES = frozenset(('identical', 'in_tolerance', 'ignored'))
+_TABLE_UNCHANGED_STATUSES = frozenset(('identical', 'ignored'))
+
+
 class ComparisonResult(BaseModel):
     """Base result class for filtered comparison results."""
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(ser_json_inf_nan='constants', defer_build=True)
     
     fields: List[FieldResult] = Field(default_factory=list, description="Individual field results")
     
@@ -150,10 +229,10 @@ class ComparisonResult(BaseModel):
         # Filter fields based on detail level
         if detail == 'failures':
             # Only show fields that failed (not identical, not in tolerance, not ignored)
-            filtered_fields = [f for f in self.fields if f.status not in ['identical', 'in_tolerance', 'ignored']]
+            filtered_fields = [f for f in self.fields if f.status not in _TABLE_PASSING_STATUSES]
         elif detail == 'differences':
             # Show fields that are different (not identical, not ignored)
-            filtered_fields = [f for f in self.fields if f.status not in ['identical', 'ignored']]
+            filtered_fields = [f for f in self.fields if f.status not in _TABLE_UNCHANGED_STATUSES]
         elif detail == 'all':
             # Show all fields
             filtered_fields = self.fields
@@ -163,82 +242,41 @@ class ComparisonResult(BaseModel):
         if not filtered_fields:
             return "No fields match the specified detail level"
         
-        # Create table header
-        header = "Field Name                      | Status     | Expected | Actual   | Reason"
-        separator = "-" * len(header)
-        
-        # Create table rows
-        rows = []
-        for field in filtered_fields:
-            # Truncate long values for display
-            expected_str = str(field.expected)[:8] + "..." if len(str(field.expected)) > 8 else str(field.expected)
-            actual_str = str(field.actual)[:8] + "..." if len(str(field.actual)) > 8 else str(field.actual)
-            
-            # Convert status to simpler format
-            status_map = {
-                'identical': 'match',
-                'in_tolerance': 'tolerated',
-                'outside_tolerance': 'fail',
-                'type_mismatch': 'fail',
-                'missing_required': 'fail',
-                'optional_missing': 'tolerated',
-                'value_mismatch': 'fail',
-                'object_missing': 'fail',
-                'array_length_mismatch': 'fail',
-                'ignored': 'ignored'
-            }
-            simple_status = status_map.get(field.status, field.status)
-            
-            # Create shorter reason text
-            reason_str = self._create_short_reason(field)
-            
-            # Truncate field name from the left if too long (30 char column width)
-            field_name_str = field.name
-            if len(field_name_str) > 30:
-                field_name_str = "..." + field_name_str[-(30-3):]  # Keep last 27 chars + "..."
-            
-            row = f"{field_name_str:<30} | {simple_status:<10} | {expected_str:<8} | {actual_str:<8} | {reason_str}"
-            rows.append(row)
+        # Local aliases keep the per-row work to plain local lookups
+        status_get = _SIMPLE_STATUS_MAP.get
+        short_reason = self._create_short_reason
+        row = _TABLE_ROW
+        truncate = _truncate_cell
+        truncate_name = _truncate_field_name
         
-        # Combine header, separator, and rows
-        table_lines = [header, separator] + rows
-        return "\n".join(table_lines)
+        lines = [_TABLE_HEADER, _TABLE_SEPARATOR]
+        lines.extend([
+            row(truncate_name(f.name), status_get(f.status, f.status),
+                truncate(f.expected), truncate(f.actual), short_reason(f))
+            for f in filtered_fields
+        ])
+        return "\n".join(lines)
     
     def _create_short_reason(self, field: 'FieldResult') -> str:
         """Create a short reason string for table display."""
-        if field.status == 'identical':
-            return 'exact'
-        elif field.status == 'in_tolerance':
-            if field.tolerance_applied:
-                return f"< {field.tolerance_applied}"
-            else:
-                return 'tolerated'
-        elif field.status == 'outside_tolerance':
-            if field.tolerance_applied:
-                return f"> {field.tolerance_applied}"
-            else:
-                return 'failed'
-        elif field.status == 'type_mismatch':
-            return 'type'
-        elif field.status == 'missing_required':
-            return 'missing'
-        elif field.status == 'optional_missing':
-            return 'optional'
-        elif field.status == 'value_mismatch':
-            return 'exact'
-        elif field.status == 'object_missing':
-            return 'missing'
-        elif field.status == 'array_length_mismatch':
-            return 'length'
-        elif field.status == 'ignored':
-            return 'ignored'
-        else:
-            return field.reason[:20] + "..." if len(field.reason) > 20 else field.reason
+        status = field.status
+        short = _SHORT_REASONS.get(status)
+        if short is not None:
+            return short
+        tolerance = _TOLERANCE_SHORT_REASONS.get(status)
+        if tolerance is not None:
+            prefix, fallback = tolerance
+            return f"{prefix}{field.tolerance_applied}" if field.tolerance_applied else fallback
+        return field.reason[:20] + "..." if len(field.reason) > 20 else field.reason
     
     def to_json(self) -> str:
         """Convert result to JSON string."""
-        import json
-        return json.dumps(self.model_dump(), indent=2)
+        output = self.model_dump_json(indent=2)
+        # Non-ASCII can only appear inside JSON strings, so escaping it keeps
+        # the json.dumps output format
+        if output.isascii():
+            return output
+        return _NON_ASCII.sub(_escape_non_ascii, output)
     
     def _get_filtered_fields(self, detail: LoggingDetail) -> List[FieldResult]:
         """Get fields filtered by logging level."""
@@ -253,22 +291,23 @@ class ComparisonResult(BaseModel):
 
 class FullComparisonResult(ComparisonResult):
     """Complete result of an object comparison with overall status."""
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(ser_json_inf_nan='constants', defer_build=True)
     
     matches: bool = Field(..., description="Overall pass/fail result")
     summary: str = Field(..., description="Human-readable summary")
     
-    def filter(self, status_filter: 'ComparisonStatus') -> ComparisonResult:
+    def filter(self, *status_filters: 'ComparisonStatus') -> ComparisonResult:
         """Filter results by comparison status.
         
         Args:
-            status_filter: Status to filter by
+            *status_filters: One or more statuses to filter by
             
         Returns:
-            Filtered ComparisonResult with only fields matching the status
+            Filtered ComparisonResult with only fields matching any of the
+            statuses, in their original order
         """
-        filtered_fields = [f for f in self.fields if f.status == status_filter.value]
-        return ComparisonResult(fields=filtered_fields)
+        wanted = frozenset(status_filters)
+        return ComparisonResult(fields=[f for f in self.fields if f.status in wanted])
     
     def auto_log(self, logging_config: 'LoggingConfig', expected: Any = None, actual: Any = None, tolerances: Dict = None) -> None:
         """Automatically log comparison result based on configuration.
@@ -284,13 +323,32 @@ class FullComparisonResult(ComparisonResult):
             return
         
         # Get logger
-        logger = logging.getLogger(logging_config.logger_name)
+        logger = _get_logger(logging_config.logger_name)
+        
+        # Check if we should log based on 'when' setting
+        should_log = logging_config.when == "always" or (logging_config.when == "on_fail" and not self.matches)
+        
+        # Decide what will be emitted before doing any work, so a passing
+        # comparison under when="on_fail" returns without formatting anything
+        debug_enabled = expected is not None and actual is not None and logger.isEnabledFor(logging.DEBUG)
+        
+        # If enabled is None, auto-detect from logger level
+        if should_log and logging_config.enabled is None:
+            # Only log if logger is enabled for INFO level or higher
+            should_log = logger.isEnabledFor(logging.INFO)
+        
+        # Don't format a result the logger would drop anyway
+        if should_log:
+            should_log = logger.isEnabledFor(logging_config.level)
+        
+        if not should_log and not debug_enabled:
+            return
         
         # Generate comparison ID for correlating outputs
         comparison_id = _generate_comparison_id()
         
         # Add debug logging for raw objects and comparison profile
-        if logger.isEnabledFor(logging.DEBUG) and expected is not None and actual is not None:
+        if debug_enabled:
             logger.debug(f"Expected data (JSON) [ID: {comparison_id}]:\n{json.dumps(expected, indent=2, default=str)}")
             logger.debug(f"Actual data (JSON) [ID: {comparison_id}]:\n{json.dumps(actual, indent=2, default=str)}")
             
@@ -324,19 +382,6 @@ class FullComparisonResult(ComparisonResult):
                     logger.debug(f"Could not serialize comparison profile: {e}")
             
         
-        # If enabled is None, auto-detect from logger level
-        if logging_config.enabled is None:
-            # Only log if logger is enabled for INFO level or higher
-            if not logger.isEnabledFor(logging.INFO):
-                return
-        
-        # Check if we should log based on 'when' setting
-        should_log = False
-        if logging_config.when == "always":
-            should_log = True
-        elif logging_config.when == "on_fail" and not self.matches:
-            should_log = True
-            
         if not should_log:
             return
             
@@ -361,6 +406,8 @@ class FullComparisonResult(ComparisonResult):
 
 class FieldSettings(BaseModel):
     """Settings for a specific field pattern."""
+    model_config = ConfigDict(defer_build=True)
+    
     # Tolerance settings (mutually exclusive with behavior settings)
     percentage: Optional[float] = Field(None, ge=0, description="Percentage tolerance")
     absolute: Optional[float] = Field(None, ge=0, description="Absolute tolerance")
@@ -370,22 +417,6 @@ class FieldSettings(BaseModel):
     ignore: Optional[bool] = Field(None, description="Skip field entirely")
     text_validation: Optional[bool] = Field(None, description="Only check not empty")
     
-    @field_validator('percentage', 'absolute')
-    @classmethod
-    def tolerance_settings(cls, v, info):
-        """Ensure tolerance settings are valid."""
-        # This validator runs for each field individually, so we can't check other fields here
-        # The mutual exclusivity check will be done in the model_validator
-        return v
-    
-    @field_validator('required', 'ignore', 'text_validation')
-    @classmethod
-    def behavior_settings(cls, v, info):
-        """Ensure behavior settings are mutually exclusive with tolerance settings."""
-        # This validator runs for each field individually, so we can't check other fields here
-        # The mutual exclusivity check will be done in the model_validator
-        return v
-    
     @model_validator(mode='after')
     def validate_field_settings(self):
         """Validate the complete field settings."""
@@ -428,5 +459,6 @@ class CompareProfile(BaseModel):
     
     model_config = ConfigDict(
         extra="forbid",  # Don't allow extra fields
-        validate_assignment=True  # Validate on assignment
+        validate_assignment=True,  # Validate on assignment
+        defer_build=True  # Build the validator on first use, not at import
     )
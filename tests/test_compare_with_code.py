@@ -5,8 +5,10 @@ These tests create profiles programmatically to match the same scenarios as
 YAML-based tests, ensuring identical behavior with different data sources.
 """
 
+import subprocess
+import sys
 import pytest
-from pyobcomp import CompareProfile, FieldSettings, ComparisonOptions
+from pyobcomp import create, CompareProfile, FieldSettings, ComparisonOptions
 from .helpers.compare import BaseCompareTests
 
 
@@ -145,3 +147,29 @@ class TestCompareWithCode(BaseCompareTests):
     def get_test_data(self, test_name):
         """Get profile and data from dictionary."""
         return self.test_data[test_name]
+
+
+class TestFieldPaths:
+    """Tests for the field names built for nested values."""
+    
+    def test_non_string_keys(self):
+        """Test dicts with int keys, including one holding a list."""
+        comparer = create(CompareProfile())
+        result = comparer.compare({1: [1, 2], 2: {3: 'a'}}, {1: [1, 2], 2: {3: 'b'}})
+        
+        assert result.matches == False
+        assert [f.name for f in result.fields] == ['1[0]', '1[1]', '2.3']
+        assert [f.passed for f in result.fields] == [True, True, False]
+
+
+def test_submodules_reachable_as_attributes():
+    """Test that submodules resolve as package attributes after a bare import."""
+    script = (
+        "import pyobcomp\n"
+        "for name in ('models', 'comparer', 'factory', 'comparator', 'config'):\n"
+        "    print(getattr(pyobcomp, name).__name__)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    assert output.split() == [
+        'pyobcomp.models', 'pyobcomp.comparer', 'pyobcomp.factory', 'pyobcomp.comparator', 'pyobcomp.config'
+    ]
@@ -220,4 +220,20 @@ options:
             assert result2.matches == True
             
         finally:
-            os.unlink(temp_file)
\ No newline at end of file
+            os.unlink(temp_file)
+
+    def test_extend_template_modify_field_settings(self):
+        """Test changing an existing field's settings on a copied profile."""
+        base_profile = load_profile("tests/samples/extend_template/base_config.yaml")
+        expected = {'calories': 200, 'protein': 25.5, 'carbs': 30}
+        actual = {'calories': 220, 'protein': 25.5, 'carbs': 30}
+        
+        # 10% off is outside the base 5% tolerance
+        assert create(base_profile).compare(expected, actual).matches == False
+        
+        # Loosen the tolerance in place on a deep copy of the template
+        extended_profile = base_profile.model_copy(deep=True)
+        extended_profile.fields['calories'].percentage = 15.0
+        
+        assert create(extended_profile).compare(expected, actual).matches == True
+        assert base_profile.fields['calories'].percentage == 5.0
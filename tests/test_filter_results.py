@@ -88,3 +88,69 @@ class TestFilterResults:
         assert protein_field.status == ComparisonStatus.IDENTICAL.value
         assert fat_field.status == ComparisonStatus.OUTSIDE_TOLERANCE.value
         assert carbs_field.status == ComparisonStatus.IN_TOLERANCE.value
+    
+    def test_filter_reflects_added_fields(self):
+        """Test that filtering picks up fields appended after a previous filter."""
+        result = self.comparer.compare(self.expected_data, self.actual_data)
+        
+        assert len(result.filter(ComparisonStatus.IDENTICAL).fields) == 1
+        
+        # Appending a field must not be hidden by the status grouping built above
+        protein_field = next(f for f in result.fields if f.name == 'protein')
+        result.fields.append(protein_field)
+        assert len(result.filter(ComparisonStatus.IDENTICAL).fields) == 2
+        
+        # Filtered results are independent copies
+        result.filter(ComparisonStatus.IDENTICAL).fields.clear()
+        assert len(result.filter(ComparisonStatus.IDENTICAL).fields) == 2
+    
+    def test_filter_reflects_changed_fields(self):
+        """Test that filtering picks up fields replaced or updated in place."""
+        result = self.comparer.compare(self.expected_data, self.actual_data)
+        
+        assert [f.name for f in result.filter(ComparisonStatus.IDENTICAL).fields] == ['protein']
+        assert 'fat' in result.format_table(detail='failures')
+        
+        # Change a status in place and replace another field at the same index
+        fat_field = next(f for f in result.fields if f.name == 'fat')
+        fat_field.status = ComparisonStatus.IDENTICAL.value
+        fat_field.passed = True
+        protein_index = next(i for i, f in enumerate(result.fields) if f.name == 'protein')
+        result.fields[protein_index] = next(f for f in result.fields if f.name == 'carbs')
+        
+        assert [f.name for f in result.filter(ComparisonStatus.IDENTICAL).fields] == ['fat']
+        assert result.format_table(detail='failures') == "No fields match the specified detail level"
+    
+    def test_filter_multiple_statuses(self):
+        """Test filtering by several statuses at once."""
+        result = self.comparer.compare(self.expected_data, self.actual_data)
+        
+        filtered_result = result.filter(ComparisonStatus.IN_TOLERANCE, ComparisonStatus.OUTSIDE_TOLERANCE)
+        
+        # Fields keep their original order
+        expected_names = [f.name for f in result.fields if f.name != 'protein']
+        assert [f.name for f in filtered_result.fields] == expected_names
+    
+    def test_only_failures_option(self):
+        """Test that only_failures skips recording fields that passed."""
+        self.profile.options.only_failures = True
+        comparer = create(self.profile)
+        result = comparer.compare(self.expected_data, self.actual_data)
+        
+        assert not result.matches
+        assert [f.name for f in result.fields] == ['fat']
+        assert result.fields[0].status == ComparisonStatus.OUTSIDE_TOLERANCE.value
+        
+        # Matching objects produce no field results at all
+        assert comparer.compare(self.expected_data, self.expected_data).fields == []
+    
+    def test_status_compares_as_string(self):
+        """Test that statuses and their string values are interchangeable."""
+        result = self.comparer.compare(self.expected_data, self.actual_data)
+        
+        fat_field = next(f for f in result.fields if f.name == 'fat')
+        assert fat_field.status == ComparisonStatus.OUTSIDE_TOLERANCE
+        
+        by_enum = result.filter(ComparisonStatus.IN_TOLERANCE, ComparisonStatus.OUTSIDE_TOLERANCE)
+        by_string = result.filter('in_tolerance', 'outside_tolerance')
+        assert [f.name for f in by_string.fields] == [f.name for f in by_enum.fields]
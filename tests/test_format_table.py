@@ -1,9 +1,11 @@
 """
 Tests for diff formatting functionality.
 """
+import json
 import pytest
 from pyobcomp import create, CompareProfile, FieldSettings
-from pyobcomp.models import ComparisonStatus, ComparisonResult
+from pydantic import ValidationError
+from pyobcomp.models import ComparisonStatus, ComparisonResult, FieldResult
 
 
 class TestFormat:
@@ -82,3 +84,41 @@ class TestFormat:
         assert 'protein' in output
         assert 'fat' in output
         assert 'carbs' in output
+    
+    def test_comparer_fields_match_validated_fields(self):
+        """Test that comparer-built fields format like validated FieldResults."""
+        result = self.comparer.compare(self.expected_data, self.actual_data)
+        rebuilt = ComparisonResult(fields=[FieldResult(**f.model_dump()) for f in result.fields])
+        
+        assert rebuilt.fields == result.fields
+        assert rebuilt.to_json() == ComparisonResult(fields=result.fields).to_json()
+        for detail in ('failures', 'differences', 'all'):
+            assert rebuilt.format_table(detail=detail) == result.format_table(detail=detail)
+        
+        # Results stay pydantic models with their fields-set and copy support
+        fat_field = next(f for f in result.fields if f.name == 'fat')
+        assert fat_field.model_fields_set == {
+            'name', 'passed', 'status', 'expected', 'actual', 'reason', 'tolerance_applied'
+        }
+        assert fat_field.model_copy(update={'passed': True}).passed == True
+    
+    def test_to_json_matches_json_dumps(self):
+        """Test that to_json escapes non-ASCII and writes NaN the way json.dumps does."""
+        result = self.comparer.compare(
+            {"name": "café", "icon": "\U0001f600", "score": float('nan')},
+            {"name": "cafe", "icon": "\U0001f600", "score": float('inf')}
+        )
+        output = result.to_json()
+        
+        assert output == json.dumps(result.model_dump(mode='json'), indent=2)
+        assert '\\u00e9' in output and '\\ud83d\\ude00' in output
+        assert 'NaN' in output and 'Infinity' in output
+    
+    def test_field_result_validation(self):
+        """Test that FieldResult still validates values passed to it."""
+        with pytest.raises(ValidationError):
+            FieldResult(name=1, passed='x', status=3, expected=None, actual=None, reason=None)
+        
+        field = FieldResult(name='a', passed=True, status=ComparisonStatus.IDENTICAL,
+                            expected=1, actual=1, reason='Values match exactly')
+        assert field.status == 'identical'
@@ -6,7 +6,7 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
-from pyobcomp import load_profile, create_from_file
+from pyobcomp import load_profile, create_from_file, ComparerFactory
 from pyobcomp.models import FieldSettings, ComparisonOptions
 from .helpers.config import Helper
 
@@ -106,3 +106,81 @@ fields:
             
         finally:
             os.unlink(temp_file)
+
+    def test_reload_after_change(self):
+        """Test that cached profiles are independent and refreshed when the file changes."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write('fields:\n  "calories":\n    percentage: 5.0\n')
+            temp_file = f.name
+        
+        try:
+            first = load_profile(temp_file)
+            second = load_profile(temp_file)
+            assert first is not second
+            first.fields['calories'] = FieldSettings(absolute=1.0)
+            assert second.fields['calories'].percentage == 5.0
+            
+            with open(temp_file, 'w') as f:
+                f.write('fields:\n  "calories":\n    percentage: 10.0\n')
+            stat = os.stat(temp_file)
+            os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            profile = load_profile(temp_file)
+            assert profile.fields['calories'].percentage == 10.0
+            
+            ComparerFactory.clear_cache()
+            assert load_profile(temp_file).fields['calories'].percentage == 10.0
+            
+        finally:
+            os.unlink(temp_file)
+
+    def test_load_without_validation(self):
+        """Test loading trusted profiles without full validation."""
+        profile = load_profile("tests/samples/valid/config.yaml", validate=False)
+        assert profile == load_profile("tests/samples/valid/config.yaml")
+        
+        # Conflicting settings are still rejected
+        with pytest.raises(ValueError, match="Field cannot have multiple behavior settings"):
+            load_profile("tests/samples/invalid/config.yaml", validate=False)
+
+    def test_unvalidated_int_flags(self):
+        """Test that integer flags from an unvalidated profile still take effect."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("fields:\n  fiber:\n    ignore: 1\n  notes:\n    text_validation: 1\n")
+            temp_file = f.name
+        
+        try:
+            comparer = ComparerFactory.create(load_profile(temp_file, validate=False))
+            result = comparer.compare({"fiber": 3, "notes": "a"}, {"fiber": 5, "notes": "b"})
+            
+            statuses = {f.name: f.status for f in result.fields}
+            assert statuses['fiber'] == 'ignored'
+            assert result.fields[0].passed == True
+            assert comparer.compare({"notes": "a"}, {}).matches == True
+        finally:
+            os.unlink(temp_file)
+
+    def test_json_profile(self):
+        """Test loading a profile stored as JSON."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"fields": {"calories": {"percentage": 5.0}, "fiber": {"ignore": true}},'
+                    ' "options": {"normalize_types": true}}')
+            temp_file = f.name
+        
+        try:
+            profile = load_profile(temp_file)
+            assert profile.fields['calories'].percentage == 5.0
+            assert profile.fields['fiber'].ignore == True
+            assert profile.options.normalize_types == True
+            
+        finally:
+            os.unlink(temp_file)
+
+    def test_create_from_file_not_shared(self):
+        """Test that each comparer built from a file has its own options."""
+        first = create_from_file("tests/samples/valid/config.yaml")
+        first.options.normalize_types = False
+        
+        second = create_from_file("tests/samples/valid/config.yaml")
+        assert second is not first
+        assert second.options.normalize_types == True
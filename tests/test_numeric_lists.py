@@ -0,0 +1,181 @@
+"""
+Tests for comparing long numeric lists, which may be vectorized with NumPy.
+"""
+
+import subprocess
+import sys
+import pytest
+from pyobcomp import create, CompareProfile, FieldSettings, ComparisonOptions, Comparer
+from pyobcomp import comparer as comparer_module
+from pyobcomp.models import ComparisonStatus
+
+
+LENGTH = 40
+
+
+def _field_tuples(result):
+    """Flatten result fields for comparing two results."""
+    return [
+        (f.name, f.passed, f.status, f.expected, f.actual, f.reason, f.tolerance_applied)
+        for f in result.fields
+    ]
+
+
+def _expected_values():
+    values = [float(i) + 0.5 for i in range(LENGTH)]
+    values[3] = float('nan')
+    values[4] = float('inf')
+    values[5] = float('-inf')
+    values[6] = 0.0
+    return values
+
+
+def _actual_values():
+    values = _expected_values()
+    values[1] = values[1] * 1.02    # small relative change
+    values[2] = values[2] + 5.0     # large change
+    values[4] = float('-inf')       # inf flipped sign
+    values[6] = 0.001               # change from zero
+    values[8] = float('nan')        # number became NaN
+    return values
+
+
+class TestNumericLists:
+    """Test that long numeric lists give the same fields as the element path."""
+
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def _compare_both_ways(self, monkeypatch, profile, expected, actual, vectorized_path=True):
+        """Compare with the vectorized path, then again element by element."""
+        calls = []
+        vectorized = Comparer._compare_numeric_lists
+
+        def spy(self, *args):
+            calls.append(args[0])
+            return vectorized(self, *args)
+
+        monkeypatch.setattr(Comparer, '_compare_numeric_lists', spy)
+        fast = create(profile).compare(expected, actual)
+        assert bool(calls) == vectorized_path
+
+        monkeypatch.setattr(comparer_module, '_VECTORIZE_MIN_LENGTH', 10 ** 9)
+        slow = create(profile).compare(expected, actual)
+
+        assert fast.matches == slow.matches
+        assert fast.summary == slow.summary
+        assert _field_tuples(fast) == _field_tuples(slow)
+        return fast
+
+    @pytest.mark.parametrize("settings", [
+        None,
+        FieldSettings(percentage=5.0),
+        FieldSettings(absolute=0.5),
+        FieldSettings(percentage=5.0, absolute=0.5),
+    ])
+    def test_nan_and_inf(self, monkeypatch, settings):
+        """Test float lists containing NaN and infinities."""
+        profile = CompareProfile(fields={'values.*': settings} if settings else {})
+        result = self._compare_both_ways(
+            monkeypatch, profile, {'values': _expected_values()}, {'values': _actual_values()}
+        )
+
+        assert not result.matches
+        statuses = {f.name: f.status for f in result.fields}
+        assert statuses['values[0]'] == ComparisonStatus.IDENTICAL
+        assert statuses['values[3]'] != ComparisonStatus.IDENTICAL  # NaN never equals itself
+        assert statuses['values[5]'] == ComparisonStatus.IDENTICAL
+        assert statuses['values[8]'] not in (ComparisonStatus.IDENTICAL, ComparisonStatus.IN_TOLERANCE)
+
+    @pytest.mark.parametrize("only_failures", [False, True])
+    def test_only_failures(self, monkeypatch, only_failures):
+        """Test that only_failures drops passing items on both paths."""
+        profile = CompareProfile(
+            fields={'values.*': FieldSettings(percentage=5.0)},
+            options=ComparisonOptions(only_failures=only_failures)
+        )
+        result = self._compare_both_ways(
+            monkeypatch, profile, {'values': _expected_values()}, {'values': _actual_values()}
+        )
+
+        names = [f.name for f in result.fields]
+        if only_failures:
+            assert all(not f.passed for f in result.fields)
+            # values[4] (inf vs -inf) passes: 5% of inf is an infinite tolerance
+            assert names == ['values[2]', 'values[3]', 'values[6]', 'values[8]']
+        else:
+            assert len(names) == LENGTH
+
+    @pytest.mark.parametrize("only_failures", [False, True])
+    def test_shorter_actual(self, monkeypatch, only_failures):
+        """Test that items missing from a shorter actual list follow the shared items."""
+        profile = CompareProfile(
+            fields={'values.*': FieldSettings(absolute=0.5)},
+            options=ComparisonOptions(only_failures=only_failures)
+        )
+        expected = [float(i) for i in range(LENGTH)]
+        actual = expected[:LENGTH - 3]
+        result = self._compare_both_ways(
+            monkeypatch, profile, {'values': expected}, {'values': actual}
+        )
+
+        assert not result.matches
+        assert result.fields[0].name == 'values.length'
+        assert result.fields[0].status == ComparisonStatus.ARRAY_LENGTH_MISMATCH
+        missing = result.fields[-3:]
+        assert [f.name for f in missing] == [f'values[{i}]' for i in range(LENGTH - 3, LENGTH)]
+        assert all(f.status == ComparisonStatus.MISSING_REQUIRED for f in missing)
+        assert all(f.actual is None for f in missing)
+        if only_failures:
+            assert len(result.fields) == 4
+
+    def test_int_float_mix(self, monkeypatch):
+        """Test ints and floats in the same positions under normalize_types."""
+        profile = CompareProfile(
+            fields={'values.*': FieldSettings(absolute=0.5)},
+            options=ComparisonOptions(normalize_types=True)
+        )
+        expected = list(range(LENGTH))
+        actual = [float(i) if i % 3 else i for i in range(LENGTH)]
+        actual[10] = 10.4
+        result = self._compare_both_ways(monkeypatch, profile, {'values': expected}, {'values': actual})
+
+        assert result.matches
+        statuses = {f.name: f.status for f in result.fields}
+        assert statuses['values[1]'] == ComparisonStatus.IDENTICAL
+        assert statuses['values[10]'] == ComparisonStatus.IN_TOLERANCE
+
+    @pytest.mark.parametrize("item_settings", [
+        FieldSettings(ignore=True),
+        FieldSettings(absolute=10.0),
+    ])
+    def test_mixed_item_configs_fall_back(self, monkeypatch, item_settings):
+        """Test that items resolving to different configs are compared one by one."""
+        profile = CompareProfile(fields={
+            'values[2]': item_settings,
+            'values.*': FieldSettings(percentage=5.0),
+        })
+        result = self._compare_both_ways(
+            monkeypatch, profile, {'values': _expected_values()}, {'values': _actual_values()}
+        )
+
+        statuses = {f.name: f.status for f in result.fields}
+        assert statuses['values[1]'] == ComparisonStatus.IN_TOLERANCE
+        assert statuses['values[2]'] in (ComparisonStatus.IGNORED, ComparisonStatus.IN_TOLERANCE)
+
+
+def test_numpy_imported_only_for_long_lists():
+    """Test that NumPy is not imported until a list is long enough to vectorize."""
+    pytest.importorskip("numpy")
+    script = (
+        "import sys\n"
+        "from pyobcomp import create, CompareProfile\n"
+        "comparer = create(CompareProfile())\n"
+        "comparer.compare({'a': [1.0] * 5}, {'a': [1.0] * 5})\n"
+        "print('numpy' in sys.modules)\n"
+        f"comparer.compare({{'a': [1.0] * {LENGTH}}}, {{'a': [1.0] * {LENGTH}}})\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['False', 'True']
@@ -0,0 +1,373 @@
+"""
+Tests for the legacy ObjectComparator.
+"""
+
+import subprocess
+import sys
+import pytest
+from pyobcomp import comparator
+from pyobcomp.comparator import ObjectComparator
+from pyobcomp.config import ToleranceConfig, FieldConfig, ComparisonOptions, ComparisonStatus
+
+
+def _field_tuples(result):
+    """Flatten result fields for comparing two results."""
+    return [
+        (f.name, f.passed, f.status, f.expected, f.actual, f.reason, f.tolerance_applied)
+        for f in result.fields
+    ]
+
+
+class TestVectorizedFloatLists:
+    """Test that long numeric lists give the same fields as the element path."""
+
+    LENGTH = 40
+
+    def _expected_values(self):
+        values = [float(i) + 0.5 for i in range(self.LENGTH)]
+        values[3] = float('nan')
+        values[4] = float('inf')
+        values[5] = float('-inf')
+        values[6] = 0.0
+        values[7] = -12.5
+        return values
+
+    def _actual_values(self):
+        values = self._expected_values()
+        values[1] = values[1] * 1.02        # small relative change
+        values[2] = values[2] + 5.0         # large change
+        values[4] = float('-inf')           # inf flipped sign
+        values[5] = float('-inf')           # same inf
+        values[6] = 0.001                   # change from zero
+        values[8] = float('nan')            # number became NaN
+        return values
+
+    def _compare_both_ways(self, monkeypatch, tolerances, expected, actual, options=None, vectorized_path=True):
+        """Compare with the vectorized path, then again element by element."""
+        pytest.importorskip("numpy")
+        calls = []
+        vectorized = ObjectComparator._compare_float_lists
+
+        def spy(self, *args):
+            calls.append(args[0])
+            return vectorized(self, *args)
+
+        monkeypatch.setattr(ObjectComparator, '_compare_float_lists', spy)
+        fast = ObjectComparator(tolerances, options).compare(expected, actual)
+        assert bool(calls) == vectorized_path
+
+        monkeypatch.setattr(comparator, '_VECTORIZE_MIN_LENGTH', 10 ** 9)
+        slow = ObjectComparator(tolerances, options).compare(expected, actual)
+
+        assert fast.matches == slow.matches
+        assert fast.summary == slow.summary
+        assert _field_tuples(fast) == _field_tuples(slow)
+        return fast
+
+    @pytest.mark.parametrize("tolerance", [
+        None,
+        ToleranceConfig(percentage=5.0),
+        ToleranceConfig(absolute=0.5),
+        ToleranceConfig(percentage=5.0, absolute=0.5),
+    ])
+    def test_floats_with_nan_and_inf(self, monkeypatch, tolerance):
+        """Test float lists containing NaN and infinities."""
+        tolerances = {'values.*': tolerance} if tolerance else {}
+        result = self._compare_both_ways(
+            monkeypatch, tolerances,
+            {'values': self._expected_values()}, {'values': self._actual_values()}
+        )
+        assert not result.matches
+        assert len(result.fields) == self.LENGTH
+
+    def test_identical_lists(self, monkeypatch):
+        """Test that identical lists report every item as identical."""
+        values = self._expected_values()
+        values[3] = 3.5  # NaN never equals itself
+        result = self._compare_both_ways(
+            monkeypatch, {'values.*': ToleranceConfig(percentage=1.0)},
+            {'values': values}, {'values': list(values)}
+        )
+        assert result.matches
+        assert all(f.status == ComparisonStatus.IDENTICAL for f in result.fields)
+
+    def test_int_float_mix_normalized(self, monkeypatch):
+        """Test ints and floats in the same positions under normalize_types."""
+        expected = list(range(self.LENGTH))
+        actual = [float(i) if i % 3 else i for i in range(self.LENGTH)]
+        actual[10] = 10.4
+        actual[11] = 13
+        result = self._compare_both_ways(
+            monkeypatch, {'values.*': ToleranceConfig(absolute=0.5)},
+            {'values': expected}, {'values': actual},
+            ComparisonOptions(normalize_types=True)
+        )
+        statuses = {f.name: f.status for f in result.fields}
+        assert statuses['values[1]'] == ComparisonStatus.IDENTICAL
+        assert statuses['values[10]'] == ComparisonStatus.IN_TOLERANCE
+        assert statuses['values[11]'] == ComparisonStatus.OUTSIDE_TOLERANCE
+
+    def test_int_float_mix_not_normalized(self, monkeypatch):
+        """Test that int/float pairs stay type mismatches without normalize_types."""
+        expected = list(range(self.LENGTH))
+        actual = [float(i) if i % 3 else i for i in range(self.LENGTH)]
+        result = self._compare_both_ways(
+            monkeypatch, {'values.*': ToleranceConfig(absolute=0.5)},
+            {'values': expected}, {'values': actual}, vectorized_path=False
+        )
+        statuses = {f.name: f.status for f in result.fields}
+        assert statuses['values[1]'] == ComparisonStatus.TYPE_MISMATCH
+        assert statuses['values[3]'] == ComparisonStatus.IDENTICAL
+
+    def test_large_ints_not_vectorized(self, monkeypatch):
+        """Test that ints too large for exact float64 math use the element path."""
+        expected = [2 ** 60 + i for i in range(self.LENGTH)]
+        actual = list(expected)
+        actual[0] += 1
+        result = self._compare_both_ways(
+            monkeypatch, {'values.*': ToleranceConfig(absolute=0.5)},
+            {'values': expected}, {'values': actual},
+            ComparisonOptions(normalize_types=True), vectorized_path=False
+        )
+        assert result.fields[0].status == ComparisonStatus.OUTSIDE_TOLERANCE
+
+    def test_mixed_item_rules_fall_back(self, monkeypatch):
+        """Test that items resolving to different rules are compared one by one."""
+        expected = self._expected_values()
+        actual = self._actual_values()
+        tolerances = {
+            'values[2]': FieldConfig(ignore=True, required=False),
+            'values.*': ToleranceConfig(percentage=5.0),
+        }
+        result = self._compare_both_ways(
+            monkeypatch, tolerances, {'values': expected}, {'values': actual}
+        )
+        statuses = {f.name: f.status for f in result.fields}
+        assert statuses['values[2]'] == ComparisonStatus.IGNORED
+        assert statuses['values[1]'] == ComparisonStatus.IN_TOLERANCE
+
+
+def test_numpy_imported_only_for_long_lists():
+    """Test that NumPy is not imported until a list is long enough to vectorize."""
+    pytest.importorskip("numpy")
+    script = (
+        "import sys\n"
+        "from pyobcomp.comparator import ObjectComparator\n"
+        "comparator = ObjectComparator()\n"
+        "comparator.compare({'a': [1.0] * 5, 'b': 1.5}, {'a': [1.0] * 5, 'b': 2.5})\n"
+        "print('numpy' in sys.modules)\n"
+        "comparator.compare({'a': [1.0] * 40}, {'a': [1.0] * 40})\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['False', 'True']
+
+
+class TestNdarrays:
+    """Test NumPy arrays compared as single fields."""
+
+    def setup_method(self):
+        self.np = pytest.importorskip("numpy")
+
+    def test_shape_mismatch(self):
+        """Test arrays with different shapes."""
+        np = self.np
+        result = ObjectComparator().compare({'grid': np.zeros((2, 3))}, {'grid': np.zeros((3, 2))})
+
+        assert not result.matches
+        [field] = result.fields
+        assert field.name == 'grid.shape'
+        assert field.status == ComparisonStatus.ARRAY_LENGTH_MISMATCH
+        assert field.expected == (2, 3)
+        assert field.actual == (3, 2)
+
+    def test_identical(self):
+        """Test equal arrays without any tolerance."""
+        np = self.np
+        result = ObjectComparator().compare({'grid': np.arange(6.0)}, {'grid': np.arange(6.0)})
+
+        assert result.matches
+        assert result.fields[0].status == ComparisonStatus.IDENTICAL
+
+    def test_no_tolerance(self):
+        """Test differing arrays without a tolerance."""
+        np = self.np
+        result = ObjectComparator().compare({'grid': np.arange(6.0)}, {'grid': np.arange(6.0) + 0.1})
+
+        assert not result.matches
+        assert result.fields[0].status == ComparisonStatus.VALUE_MISMATCH
+
+    def test_tolerance(self):
+        """Test element-wise tolerance where the greater tolerance wins."""
+        np = self.np
+        expected = np.array([0.0, 10.0, 100.0])
+        c = ObjectComparator({'grid': ToleranceConfig(percentage=10.0, absolute=0.5)})
+
+        # 0.4 is within the absolute floor, 9.0 within 10% of 100
+        within = c.compare({'grid': expected}, {'grid': expected + np.array([0.4, 0.9, 9.0])})
+        assert within.matches
+        assert within.fields[0].status == ComparisonStatus.IN_TOLERANCE
+        assert within.fields[0].tolerance_applied == "10.0% or 0.5 absolute"
+
+        outside = c.compare({'grid': expected}, {'grid': expected + np.array([0.6, 0.9, 11.0])})
+        assert not outside.matches
+        assert outside.fields[0].status == ComparisonStatus.OUTSIDE_TOLERANCE
+        assert "2 of 3 elements differ" in outside.fields[0].reason
+
+    def test_nan_is_outside_tolerance(self):
+        """Test that a NaN element never counts as within tolerance."""
+        np = self.np
+        c = ObjectComparator({'grid': ToleranceConfig(absolute=1.0)})
+        result = c.compare({'grid': np.array([1.0, 2.0])}, {'grid': np.array([1.0, np.nan])})
+
+        assert not result.matches
+        assert result.fields[0].status == ComparisonStatus.OUTSIDE_TOLERANCE
+
+
+class TestPatternMatching:
+    """Test wildcard field patterns."""
+
+    def _status(self, tolerances, expected, actual, name):
+        result = ObjectComparator(tolerances).compare(expected, actual)
+        return next(f.status for f in result.fields if f.name == name)
+
+    def test_leading_wildcard(self):
+        """Test that a leading * matches any prefix, including list indices."""
+        tolerances = {'*.calories': ToleranceConfig(absolute=5.0)}
+        expected = {'meal': {'calories': 100}, 'items': [{'calories': 50}]}
+        actual = {'meal': {'calories': 103}, 'items': [{'calories': 54}]}
+
+        assert self._status(tolerances, expected, actual, 'meal.calories') == ComparisonStatus.IN_TOLERANCE
+        assert self._status(tolerances, expected, actual, 'items[0].calories') == ComparisonStatus.IN_TOLERANCE
+
+    def test_bare_wildcard(self):
+        """Test that * alone matches every path."""
+        tolerances = {'*': ToleranceConfig(absolute=5.0)}
+        assert self._status(tolerances, {'a': {'b': 1}}, {'a': {'b': 4}}, 'a.b') == ComparisonStatus.IN_TOLERANCE
+
+    def test_trailing_wildcard(self):
+        """Test that a* matches paths starting with a, and nothing else."""
+        tolerances = {'a*': ToleranceConfig(absolute=5.0)}
+        expected = {'apple': 1, 'avocado': {'weight': 10}, 'banana': 1}
+        actual = {'apple': 4, 'avocado': {'weight': 13}, 'banana': 4}
+
+        assert self._status(tolerances, expected, actual, 'apple') == ComparisonStatus.IN_TOLERANCE
+        assert self._status(tolerances, expected, actual, 'avocado.weight') == ComparisonStatus.IN_TOLERANCE
+        assert self._status(tolerances, expected, actual, 'banana') == ComparisonStatus.VALUE_MISMATCH
+
+    def test_first_matching_pattern_wins(self):
+        """Test that overlapping patterns resolve in configuration order."""
+        tolerances = {
+            'items.*.calories': ToleranceConfig(absolute=1.0),
+            '*': ToleranceConfig(absolute=5.0),
+        }
+        expected = {'items': [{'calories': 100}], 'other': 100}
+        actual = {'items': [{'calories': 103}], 'other': 103}
+
+        assert self._status(tolerances, expected, actual, 'items[0].calories') == ComparisonStatus.OUTSIDE_TOLERANCE
+        assert self._status(tolerances, expected, actual, 'other') == ComparisonStatus.IN_TOLERANCE
+
+    def test_dot_wildcard_needs_child(self):
+        """Test that meta.* matches children of meta, not meta or its siblings."""
+        tolerances = {'meta.*': FieldConfig(ignore=True, required=False)}
+        expected = {'meta': {'id': 1, 'tags': [1]}, 'metadata': 1}
+        actual = {'meta': {'id': 2, 'tags': [2]}, 'metadata': 2}
+
+        assert self._status(tolerances, expected, actual, 'meta.id') == ComparisonStatus.IGNORED
+        assert self._status(tolerances, expected, actual, 'meta.tags') == ComparisonStatus.IGNORED
+        assert self._status(tolerances, expected, actual, 'metadata') == ComparisonStatus.VALUE_MISMATCH
+        assert self._status(tolerances, {'meta': 1}, {'meta': 2}, 'meta') == ComparisonStatus.VALUE_MISMATCH
+
+    def test_dot_wildcard_tolerance_stays_on_children(self):
+        """Test that an items.* tolerance skips scalar items and items_total."""
+        tolerances = {'items.*': ToleranceConfig(absolute=5.0)}
+
+        assert self._status(tolerances, {'items': [10]}, {'items': [13]}, 'items[0]') == ComparisonStatus.IN_TOLERANCE
+        assert self._status(tolerances, {'items': 10}, {'items': 13}, 'items') == ComparisonStatus.VALUE_MISMATCH
+        assert self._status(tolerances, {'items_total': 10}, {'items_total': 13}, 'items_total') == ComparisonStatus.VALUE_MISMATCH
+
+    def test_regex_characters_are_literal(self):
+        """Test that characters other than * match literally."""
+        tolerances = {'a+b*': ToleranceConfig(absolute=5.0)}
+        expected = {'a+b.x': 1, 'aab.x': 1}
+        actual = {'a+b.x': 4, 'aab.x': 4}
+
+        assert self._status(tolerances, expected, actual, 'a+b.x') == ComparisonStatus.IN_TOLERANCE
+        assert self._status(tolerances, expected, actual, 'aab.x') == ComparisonStatus.VALUE_MISMATCH
+
+
+class TestIdentityCache:
+    """Test the identity result cache and batch comparison."""
+
+    def _comparator(self, cache_size=128):
+        return ObjectComparator(
+            {'value': ToleranceConfig(absolute=1.0)},
+            ComparisonOptions(enable_identity_cache=True, cache_size=cache_size)
+        )
+
+    def test_disabled_by_default(self):
+        """Test that results are not reused unless the cache is enabled."""
+        c = ObjectComparator()
+        expected, actual = {'value': 1}, {'value': 2}
+        assert c.compare(expected, actual) is not c.compare(expected, actual)
+
+    def test_cache_hit(self):
+        """Test that comparing the same objects again reuses the result."""
+        c = self._comparator()
+        expected, actual = {'value': 1.0}, {'value': 1.5}
+        first = c.compare(expected, actual)
+
+        assert c.compare(expected, actual) is first
+        # Equal but distinct objects are compared afresh
+        assert c.compare(dict(expected), dict(actual)) is not first
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at cache_size."""
+        c = self._comparator(cache_size=2)
+        pairs = [({'value': i}, {'value': i}) for i in range(3)]
+        first, second = c.compare(*pairs[0]), c.compare(*pairs[1])
+
+        # Touch the first pair so the second becomes least recently used
+        assert c.compare(*pairs[0]) is first
+        c.compare(*pairs[2])
+
+        assert c.compare(*pairs[0]) is first
+        assert c.compare(*pairs[1]) is not second
+
+    def test_clear_cache(self):
+        """Test that clear_cache drops memoized results."""
+        c = self._comparator()
+        expected, actual = {'value': 1}, {'value': 1}
+        first = c.compare(expected, actual)
+        c.clear_cache()
+
+        again = c.compare(expected, actual)
+        assert again is not first
+        assert again.matches == first.matches
+
+    def test_compare_batch(self):
+        """Test that compare_batch returns one result per pair, in order."""
+        c = ObjectComparator({'value': ToleranceConfig(absolute=1.0)})
+        results = c.compare_batch([{'value': 1.0}, {'value': 1.0}], [{'value': 1.5}, {'value': 3.0}])
+
+        assert [r.matches for r in results] == [True, False]
+
+    def test_compare_batch_length_mismatch(self):
+        """Test that compare_batch rejects sequences of different lengths."""
+        c = ObjectComparator()
+        with pytest.raises(ValueError, match="Batch length mismatch"):
+            c.compare_batch([{'value': 1}, {'value': 2}], [{'value': 1}])
+
+
+class TestFieldPaths:
+    """Test the field names built for nested values."""
+
+    def test_non_string_keys(self):
+        """Test dicts with int keys, including one holding a list."""
+        result = ObjectComparator().compare({1: [1, 2], 2: {3: 'a'}}, {1: [1, 2], 2: {3: 'b'}})
+
+        assert not result.matches
+        assert [f.name for f in result.fields] == ['1[0]', '1[1]', '2.3']
+        assert [f.status for f in result.fields] == [
+            ComparisonStatus.IDENTICAL, ComparisonStatus.IDENTICAL, ComparisonStatus.VALUE_MISMATCH
+        ]